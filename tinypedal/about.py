@@ -21,8 +21,9 @@ About window
 """
 
 import logging
+import os
 
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QUrl
 from PySide2.QtGui import QIcon, QPixmap
 from PySide2.QtWidgets import (
     QWidget,
@@ -32,6 +33,7 @@ from PySide2.QtWidgets import (
     QLabel,
     QDialogButtonBox,
     QTextBrowser,
+    QPlainTextEdit,
     QTabWidget,
 )
 
@@ -104,9 +106,15 @@ class About(QDialog):
         self.setAttribute(Qt.WA_DeleteOnClose, True)
 
         # Tab
+        self.tab_loaders = {  # tab index: (tab name, file path, tab creator)
+            1: ("Contributors", "docs/contributors.md", self.new_text_tab),
+            2: ("License", "LICENSE.txt", self.new_plain_text_tab),
+            3: ("Third-Party Notices", "docs/licenses/THIRDPARTYNOTICES.txt",
+                self.new_plain_text_tab),
+        }
         self.main_tab = QTabWidget()
         self.add_tabs()
-        self.setStyleSheet("QTextEdit {border: 0;}")
+        self.setStyleSheet("QTextEdit, QPlainTextEdit {border: 0;}")
 
         # Button
         button_close = QDialogButtonBox(QDialogButtonBox.Close)
@@ -125,33 +133,80 @@ class About(QDialog):
         self.setFixedSize(self.sizeHint().width(), self.sizeHint().height())
 
     @staticmethod
-    def load_text_files(filepath):
+    def missing_file_text(filepath):
+        """Missing file text"""
+        logger.error("MISSING: %s file not found", filepath)
+        error_text = "Error: file not found."
+        link_text = "See link: https://github.com/s-victor/TinyPedal/blob/master/"
+        return f"{error_text} \n{link_text}{filepath}"
+
+    def load_text_files(self, filepath):
         """Load text file"""
         try:
             with open(filepath, "r", encoding="utf-8") as text_file:
                 return text_file.read()
         except FileNotFoundError:
-            logger.error("MISSING: %s file not found", filepath)
-            error_text = "Error: file not found."
-            link_text = "See link: https://github.com/s-victor/TinyPedal/blob/master/"
-            return f"{error_text} \n{link_text}{filepath}"
+            return self.missing_file_text(filepath)
 
-    @staticmethod
-    def new_text_tab(text):
-        """New text tab"""
+    def new_text_tab(self, filepath):
+        """New text tab
+
+        Load text file directly from source,
+        without keeping a separate copy of file content.
+        """
         new_tab = QTextBrowser()
-        new_tab.setText(text)
+        if os.path.exists(filepath):
+            new_tab.setSource(QUrl.fromLocalFile(os.path.abspath(filepath)))
+        else:
+            new_tab.setText(self.missing_file_text(filepath))
+        new_tab.setStyleSheet("font-size: 11px;")
+        new_tab.setMinimumSize(400, 300)
+        return new_tab
+
+    def new_plain_text_tab(self, filepath):
+        """New plain text tab
+
+        Plain text layout is much faster than rich text for large file.
+        """
+        new_tab = QPlainTextEdit()
+        new_tab.setReadOnly(True)
+        new_tab.setLineWrapMode(QPlainTextEdit.NoWrap)
+        new_tab.document().setMaximumBlockCount(100000)
+        new_tab.setPlainText(self.load_text_files(filepath))
         new_tab.setStyleSheet("font-size: 11px;")
         new_tab.setMinimumSize(400, 300)
         return new_tab
 
+    @staticmethod
+    def new_placeholder_tab():
+        """New placeholder tab, same minimum size as text tab"""
+        new_tab = QWidget()
+        new_tab.setMinimumSize(400, 300)
+        return new_tab
+
     def add_tabs(self):
-        """Add tabs"""
+        """Add tabs
+
+        Text tabs are created as placeholders,
+        and only load text file on first activation.
+        """
         info_tab = AboutTab()
-        ctrb_tab = self.new_text_tab(self.load_text_files("docs/contributors.md"))
-        lics_tab = self.new_text_tab(self.load_text_files("LICENSE.txt"))
-        tpan_tab = self.new_text_tab(self.load_text_files("docs/licenses/THIRDPARTYNOTICES.txt"))
         self.main_tab.addTab(info_tab, "About")
-        self.main_tab.addTab(ctrb_tab, "Contributors")
-        self.main_tab.addTab(lics_tab, "License")
-        self.main_tab.addTab(tpan_tab, "Third-Party Notices")
+        for tab_name, _, _ in self.tab_loaders.values():
+            self.main_tab.addTab(self.new_placeholder_tab(), tab_name)
+        self.main_tab.currentChanged.connect(self.load_tab)
+
+    def load_tab(self, index):
+        """Load text tab on first activation"""
+        if index not in self.tab_loaders:
+            return None
+        tab_name, filepath, new_tab = self.tab_loaders.pop(index)
+        text_tab = new_tab(filepath)
+        placeholder = self.main_tab.widget(index)
+        self.main_tab.blockSignals(True)
+        self.main_tab.removeTab(index)
+        self.main_tab.insertTab(index, text_tab, tab_name)
+        self.main_tab.setCurrentIndex(index)
+        self.main_tab.blockSignals(False)
+        placeholder.deleteLater()
+        return None
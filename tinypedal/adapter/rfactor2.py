@@ -138,6 +138,16 @@ class Engine(DataAdapter):
         """Water temperature"""
         return chknm(self.info.rf2TeleVeh(index).mEngineWaterTemp)
 
+    def snapshot(self, index: int=None):
+        """Oil temperature, water temperature, turbo, RPM"""
+        tele_veh = self.info.rf2TeleVeh(index)
+        return (
+            chknm(tele_veh.mEngineOilTemp),
+            chknm(tele_veh.mEngineWaterTemp),
+            chknm(tele_veh.mTurboBoostPressure),
+            chknm(tele_veh.mEngineRPM),
+        )
+
 
 class Input(DataAdapter):
     """Input"""
@@ -584,6 +594,11 @@ class Vehicle(DataAdapter):
         """Raw Z position"""
         return chknm(self.info.rf2TeleVeh(index).mPos.z)
 
+    def position_xyz(self, index: int=None):
+        """Raw X, Y, Z position"""
+        pos = self.info.rf2TeleVeh(index).mPos
+        return chknm(pos.x), chknm(pos.y), chknm(pos.z)
+
     def pos_longitudinal(self, index: int=None) -> float:
         """Longitudinal axis position related to world plane"""
         return self.pos_x(index)  # in RF2 coord system
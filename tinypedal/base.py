@@ -21,6 +21,7 @@ GUI window, events.
 """
 
 from collections import namedtuple
+from functools import lru_cache
 
 from PySide2.QtCore import Qt, QTimer, Slot
 from PySide2.QtGui import QColor, QPalette, QFont, QFontMetrics
@@ -162,14 +163,12 @@ class Widget(QWidget):
 
     @staticmethod
     def get_font_metrics(name):
-        """Get font metrics"""
-        return FontMetrics(
-            width = QFontMetrics(name).averageCharWidth(),
-            height = QFontMetrics(name).height(),
-            leading = QFontMetrics(name).leading(),
-            capital = QFontMetrics(name).capHeight(),
-            descent = QFontMetrics(name).descent(),
-        )
+        """Get font metrics
+
+        Widgets mostly share the same font setting,
+        reuse cached metrics from same font family, size, weight.
+        """
+        return cached_font_metrics(name.family(), name.pixelSize(), name.weight())
 
     def calc_font_offset(self, metrics):
         """Calculate auto font vertical offset
@@ -182,6 +181,23 @@ class Widget(QWidget):
         return self.wcfg["font_offset_vertical"]
 
 
+@lru_cache(maxsize=32)
+def cached_font_metrics(family, size, weight):
+    """Create font metrics from font family, pixel size, weight"""
+    font = QFont()
+    font.setFamily(family)
+    font.setPixelSize(size)
+    font.setWeight(weight)
+    font_metrics = QFontMetrics(font)
+    return FontMetrics(
+        width = font_metrics.averageCharWidth(),
+        height = font_metrics.height(),
+        leading = font_metrics.leading(),
+        capital = font_metrics.capHeight(),
+        descent = font_metrics.descent(),
+    )
+
+
 FontMetrics = namedtuple(
     "FontMetrics",
     [
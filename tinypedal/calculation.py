@@ -20,6 +20,7 @@
 Calculation function
 """
 
+import bisect
 import math
 import random
 import statistics
@@ -220,6 +221,15 @@ def relative_time_gap(rel_dist, plr_speed, opt_speed):
     return 0
 
 
+def backoff_interval(interval, stall_ticks):
+    """Back off update interval based on consecutive stall ticks"""
+    if stall_ticks < 4:
+        return interval
+    if stall_ticks < 20:
+        return interval * 5
+    return interval * 10
+
+
 def sec2sessiontime(seconds):
     """Session time (hour/min/sec/ms)"""
     hours = seconds // 3600
@@ -303,6 +313,34 @@ def delta_telemetry(position, live_data, delta_list, condition=True, offset=0):
     return 0
 
 
+def delta_telemetry_columns(position, live_data, dist_column, data_column,
+                            condition=True, offset=0):
+    """Calculate delta telemetry data from separate column data
+
+    Distance column must be in ascending order,
+    use bisect for nearest higher index lookup.
+    """
+    index_higher = bisect.bisect_left(dist_column, position, 0, len(dist_column) - 1)
+    # At least 2 data pieces & additional condition
+    if index_higher > 0 and condition:
+        index_lower = index_higher - 1
+        return (
+            live_data + offset - linear_interp(
+                position,
+                dist_column[index_lower],
+                data_column[index_lower],
+                dist_column[index_higher],
+                data_column[index_higher],
+            )
+        )
+    return 0
+
+
+def split_columns(data_list, columns=2):
+    """Split row data list into separate column tuples"""
+    return tuple(zip(*data_list))[:columns]
+
+
 def zoom_map(map_data, map_scale, margin=0):
     """Zoom map data to specific scale, then add margin"""
     # Separate X & Y coordinates
@@ -20,18 +20,20 @@
 Heatmap function
 """
 
+from bisect import bisect_right
+
 from .setting import cfg
 from . import validator as val
 
 
-def select_color(heatmap_list: list, temperature: float) -> str:
-    """Select color from heatmap list"""
-    last_color = heatmap_list[0][1]  # set color from 1st row
-    for temp in heatmap_list:
-        if temperature < temp[0]:
-            return last_color
-        last_color = temp[1]  # set color from next row
-    return heatmap_list[-1][1]  # set color from last row if exceeded max range
+def select_color(heatmap: tuple, temperature: float) -> str:
+    """Select color from heatmap (sorted temperature & color columns)
+
+    Color of last row that temperature reaches,
+    or color of 1st row if temperature is below min range.
+    """
+    heatmap_temp, heatmap_color = heatmap
+    return heatmap_color[max(bisect_right(heatmap_temp, temperature) - 1, 0)]
 
 
 def verify_heatmap(heatmap_dict: dict) -> bool:
@@ -50,10 +52,16 @@ def sort_heatmap(heatmap_dict: dict) -> list:
         key=lambda col: col[0]
     )
 
-def load_heatmap(heatmap_name: str, default_name: str) -> list:
+
+def split_heatmap(heatmap_list: list) -> tuple:
+    """Split sorted heatmap list into temperature & color columns"""
+    return tuple(zip(*heatmap_list))
+
+
+def load_heatmap(heatmap_name: str, default_name: str) -> tuple:
     """Load heatmap preset"""
     if heatmap_name in cfg.heatmap_user:
         heatmap_dict = cfg.heatmap_user[heatmap_name]
         if verify_heatmap(heatmap_dict):
-            return sort_heatmap(heatmap_dict)
-    return sort_heatmap(cfg.heatmap_default[default_name])
+            return split_heatmap(sort_heatmap(heatmap_dict))
+    return split_heatmap(sort_heatmap(cfg.heatmap_default[default_name]))
@@ -68,7 +68,10 @@ class Realtime:
         delayed_save = False
         active_interval = self.mcfg["update_interval"] / 1000
         idle_interval = self.mcfg["idle_update_interval"] / 1000
+        min_delta_dist = max(self.mcfg["minimum_delta_distance"], 0.000001)
         update_interval = active_interval
+        bound_read = None  # API reader that read_* methods are bound to
+        save_thread = None  # last fuel data saving thread
 
         while not self.event.wait(update_interval):
             if api.state:
@@ -83,8 +86,13 @@ class Realtime:
                     pit_lap = False  # whether pit in or pit out lap
 
                     combo_id = api.read.check.combo_id()
+                    if save_thread:  # wait until last saving finished before loading
+                        save_thread.join()
+                        save_thread = None
                     delta_list_last, used_last, laptime_last = self.load_deltafuel(combo_id)
+                    dist_col_last, used_col_last = calc.split_columns(delta_list_last)
                     delta_list_curr = [DELTA_ZERO]  # distance, fuel used, laptime
+                    pos_recorded = 0  # last recorded position in delta list
                     delta_list_temp = [DELTA_ZERO]  # last lap temp
                     delta_fuel = 0  # delta fuel consumption compare to last lap
 
@@ -107,23 +115,52 @@ class Realtime:
                     pos_last = 0  # last checked vehicle position
                     pos_estimate = 0  # calculated position
                     gps_last = [0,0,0]  # last global position
+                    last_fuel_output = None  # last output fuel data
+                    output = minfo.fuel
+                    pos_stall = 0  # last position for stall check
+                    stall_ticks = 0  # consecutive ticks while stationary or in garage
+
+                # Bind API reader methods, rebind if reader replaced by API restart
+                read = api.read
+                if read is not bound_read:
+                    bound_read = read
+                    read_start = read.timing.start
+                    read_current = read.timing.current_laptime
+                    read_last = read.timing.last_laptime
+                    read_remain = read.session.remaining
+                    read_fuel = read.vehicle.fuel
+                    read_cap = read.vehicle.tank_capacity
+                    read_garage = read.vehicle.in_garage
+                    read_dist = read.lap.distance
+                    read_pos = read.vehicle.position_xyz
+                    read_lapn = read.lap.total_laps
+                    read_into = read.lap.percent
+                    read_maxl = read.lap.maximum
+                    read_pits = read.vehicle.in_pits
+                    read_ltype = read.session.lap_type
 
                 # Read telemetry
-                lap_stime = api.read.timing.start()
-                laptime_curr = max(api.read.timing.current_laptime(), 0)
-                laptime_valid = api.read.timing.last_laptime()
-                time_left = api.read.session.remaining()
-                amount_curr = api.read.vehicle.fuel()
-                capacity = max(api.read.vehicle.tank_capacity(), 1)
-                in_garage = api.read.vehicle.in_garage()
-                pos_curr = api.read.lap.distance()
-                gps_curr = (api.read.vehicle.pos_x(),
-                            api.read.vehicle.pos_y(),
-                            api.read.vehicle.pos_z())
-                lap_number = api.read.lap.total_laps()
-                lap_into = api.read.lap.percent()
-                laps_max = api.read.lap.maximum()
-                pit_lap = bool(pit_lap + api.read.vehicle.in_pits())
+                lap_stime = read_start()
+                laptime_curr = max(read_current(), 0)
+                laptime_valid = read_last()
+                time_left = read_remain()
+                amount_curr = read_fuel()
+                capacity = max(read_cap(), 1)
+                in_garage = read_garage()
+                pos_curr = read_dist()
+                gps_curr = read_pos()
+                lap_number = read_lapn()
+                lap_into = read_into()
+                laps_max = read_maxl()
+                pit_lap = pit_lap or read_pits()
+
+                # Back off update interval while stationary or in garage
+                if in_garage or pos_curr == pos_stall:
+                    stall_ticks += 1
+                else:
+                    stall_ticks = 0
+                pos_stall = pos_curr
+                update_interval = calc.backoff_interval(active_interval, stall_ticks)
 
                 # Realtime fuel consumption
                 if amount_last < amount_curr:
@@ -138,13 +175,12 @@ class Realtime:
                 if lap_stime > last_lap_stime != -1:
                     if len(delta_list_curr) > 1 and not pit_lap:
                         delta_list_curr.append(  # set end value
-                            (round(pos_last + 10, 6),
-                             round(used_curr, 6),
-                             round(lap_stime - last_lap_stime, 6))
+                            (pos_last + 10, used_curr, lap_stime - last_lap_stime)
                         )
                         delta_list_temp = delta_list_curr
                         validating = True
                     delta_list_curr = [DELTA_ZERO]  # reset
+                    pos_recorded = 0
                     pos_last = pos_curr
                     used_last_raw = used_curr
                     used_curr = 0
@@ -159,10 +195,10 @@ class Realtime:
 
                 # Update if position value is different & positive
                 if 0 <= pos_curr != pos_last:
-                    if recording and pos_curr > pos_last:  # position further
-                        delta_list_curr.append(  # keep 6 decimals
-                            (round(pos_curr, 6), round(used_curr, 6))
-                        )
+                    # Position further & exceeds minimum distance from last recorded
+                    if recording and pos_curr - pos_recorded >= min_delta_dist:
+                        delta_list_curr.append((pos_curr, used_curr))
+                        pos_recorded = pos_curr
                     pos_estimate = pos_last = pos_curr  # reset last position
 
                 # Validating 1s after passing finish line
@@ -172,20 +208,28 @@ class Realtime:
                             used_last = used_last_raw
                             laptime_last = laptime_valid
                             delta_list_last = delta_list_temp
+                            dist_col_last, used_col_last = calc.split_columns(
+                                delta_list_last)
                             delta_list_temp = [DELTA_ZERO]
                             validating = False
                             delayed_save = True
                     elif 3 < laptime_curr < 5:  # switch off after 3s
+                        delta_list_temp = [DELTA_ZERO]  # release invalid lap data
                         validating = False
 
-                # Calc delta
-                if gps_last != gps_curr:
-                    pos_estimate += calc.distance(gps_last, gps_curr)
+                # Calc delta, skip if moved less than 1 millimeter
+                gps_dx = gps_curr[0] - gps_last[0]
+                gps_dy = gps_curr[1] - gps_last[1]
+                gps_dz = gps_curr[2] - gps_last[2]
+                gps_dist_sq = gps_dx * gps_dx + gps_dy * gps_dy + gps_dz * gps_dz
+                if gps_dist_sq > 1e-6:
+                    pos_estimate += math.sqrt(gps_dist_sq)
                     gps_last = gps_curr
-                    delta_fuel = calc.delta_telemetry(
+                    delta_fuel = calc.delta_telemetry_columns(
                         pos_estimate,
                         used_curr,
-                        delta_list_last,
+                        dist_col_last,
+                        used_col_last,
                         laptime_curr > 0.3 and not in_garage,  # 300ms delay
                     )
 
@@ -194,61 +238,69 @@ class Realtime:
                     used_last, delta_fuel, 0 == pit_lap < lap_number)
 
                 # Total refuel = laps left * last consumption - remaining fuel
-                if api.read.session.lap_type():  # lap-type
+                if read_ltype():  # lap-type
                     full_laps_left = laps_max - lap_number
                     laps_left = full_laps_left - lap_into
                     amount_need = laps_left * used_est - amount_curr
                 elif laptime_last > 0:  # time-type race
                     # Make sure time into lap is not greater than last laptime
-                    rel_lap_into = math.modf(laptime_curr / laptime_last)[0] * laptime_last
+                    rel_lap_into = math.fmod(laptime_curr, laptime_last)
                     # Full laps left value counts from start line of current lap
                     full_laps_left = math.ceil((time_left + rel_lap_into) / laptime_last)
                     if laptime_curr > 0.2:  # 200ms delay check to avoid lap number desync
                         laps_left = max(full_laps_left - lap_into, 0)
                     amount_need = full_laps_left * used_est - used_curr - amount_curr
 
-                amount_left = end_stint_fuel(
-                    amount_curr, used_curr, used_est)
-
-                est_runlaps = end_stint_laps(
-                    amount_curr, used_est)
-
-                est_runmins = est_runlaps * laptime_last / 60
-
-                est_empty = end_lap_empty_capacity(
-                    capacity, amount_curr + used_curr, used_last + delta_fuel)
-
-                est_pits_late = end_stint_pit_counts(
-                    amount_need, capacity - amount_left)
-
-                est_pits_early = end_lap_pit_counts(
-                    amount_need, est_empty, capacity - amount_left)
-
-                used_est_less = less_pit_stop_consumption(
-                    est_pits_late, capacity, amount_curr, laps_left)
-
-                # Output fuel data
-                minfo.fuel.tankCapacity = capacity
-                minfo.fuel.amountFuelStart = amount_start
-                minfo.fuel.amountFuelCurrent = amount_curr
-                minfo.fuel.amountFuelNeeded = amount_need
-                minfo.fuel.amountFuelBeforePitstop = amount_left
-                minfo.fuel.lastLapFuelConsumption = used_last_raw
-                minfo.fuel.estimatedFuelConsumption = used_last + delta_fuel
-                minfo.fuel.estimatedLaps = est_runlaps
-                minfo.fuel.estimatedMinutes = est_runmins
-                minfo.fuel.estimatedEmptyCapacity = est_empty
-                minfo.fuel.estimatedNumPitStopsEnd = est_pits_late
-                minfo.fuel.estimatedNumPitStopsEarly = est_pits_early
-                minfo.fuel.deltaFuelConsumption = delta_fuel
-                minfo.fuel.oneLessPitFuelConsumption = used_est_less
+                (amount_left, est_runlaps, est_runmins, est_empty,
+                 est_pits_late, est_pits_early, used_est_less
+                 ) = end_stint_estimates(
+                    amount_curr, used_curr, used_est, used_last + delta_fuel,
+                    capacity, amount_need, laps_left, laptime_last)
+
+                # Output fuel data, skip if no change
+                fuel_output = (
+                    capacity,
+                    amount_start,
+                    amount_curr,
+                    amount_need,
+                    amount_left,
+                    used_last_raw,
+                    used_last + delta_fuel,
+                    est_runlaps,
+                    est_runmins,
+                    est_empty,
+                    est_pits_late,
+                    est_pits_early,
+                    delta_fuel,
+                    used_est_less,
+                )
+                if last_fuel_output != fuel_output:
+                    last_fuel_output = fuel_output
+                    output.tankCapacity = capacity
+                    output.amountFuelStart = amount_start
+                    output.amountFuelCurrent = amount_curr
+                    output.amountFuelNeeded = amount_need
+                    output.amountFuelBeforePitstop = amount_left
+                    output.lastLapFuelConsumption = used_last_raw
+                    output.estimatedFuelConsumption = used_last + delta_fuel
+                    output.estimatedLaps = est_runlaps
+                    output.estimatedMinutes = est_runmins
+                    output.estimatedEmptyCapacity = est_empty
+                    output.estimatedNumPitStopsEnd = est_pits_late
+                    output.estimatedNumPitStopsEarly = est_pits_early
+                    output.deltaFuelConsumption = delta_fuel
+                    output.oneLessPitFuelConsumption = used_est_less
 
             else:
                 if reset:
                     reset = False
                     update_interval = idle_interval
-                    if delayed_save:
-                        self.save_deltafuel(combo_id, delta_list_last)
+                    if delayed_save:  # save in separate thread to avoid blocking update
+                        save_thread = threading.Thread(
+                            target=self.save_deltafuel,
+                            args=(combo_id, delta_list_last)
+                        )
+                        save_thread.start()
 
         self.cfg.active_module_list.remove(self)
         self.stopped = True
@@ -259,7 +311,9 @@ class Realtime:
         try:
             with open(f"{self.filepath}{combo}.fuel",
                       newline="", encoding="utf-8") as csvfile:
-                lastlist = list(csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC))
+                # Plain numeric csv, split & convert each row directly
+                lastlist = [tuple(map(float, line.split(",")))
+                            for line in csvfile if not line.isspace()]
                 # Assign & test read
                 used_last = lastlist[-1][1]
                 laptime_last = lastlist[-1][2]
@@ -282,7 +336,8 @@ class Realtime:
             with open(f"{self.filepath}{combo}.fuel",
                       "w", newline="", encoding="utf-8") as csvfile:
                 deltawrite = csv.writer(csvfile)
-                deltawrite.writerows(listname)
+                deltawrite.writerows(  # keep 6 decimals
+                    [round(value, 6) for value in data] for data in listname)
 
 
 def end_lap_consumption(used_last, delta_fuel, condition):
@@ -292,51 +347,45 @@ def end_lap_consumption(used_last, delta_fuel, condition):
     return used_last
 
 
-def end_stint_fuel(amount_curr, used_curr, used_est):
-    """Estimate end-stint remaining fuel before pitting"""
-    if used_est:
-        # Total fuel at start of current lap
-        total_fuel = amount_curr + used_curr
-        # Fraction of lap counts * estimate fuel consumption
-        return math.modf(total_fuel / used_est)[0] * used_est
-    return 0
-
-
-def end_stint_laps(amount_curr, used_est):
-    """Estimate laps current fuel can last"""
+def end_stint_estimates(amount_curr, used_curr, used_est, used_lap_est,
+                        capacity, amount_need, laps_left, laptime_last):
+    """Estimate end-stint & end-lap fuel data in a single pass
+
+    Returns:
+        amount_left: end-stint remaining fuel before pitting.
+        est_runlaps: laps current fuel can last.
+        est_runmins: minutes current fuel can last.
+        est_empty: empty capacity at end of current lap.
+        est_pits_late: end-stint pit stop counts.
+        est_pits_early: end-lap pit stop counts.
+        used_est_less: fuel consumption for one less pit stop.
+    """
+    # Total fuel at start of current lap
+    total_fuel = amount_curr + used_curr
     if used_est:
+        # Remainder of total fuel after full laps of estimate fuel consumption
+        amount_left = math.fmod(total_fuel, used_est)
         # Laps = remaining fuel / estimate fuel consumption
-        return amount_curr / used_est
-    return 0
-
-
-def end_lap_empty_capacity(capacity, fuel_remain, fuel_consumption):
-    """Estimate empty capacity at end of current lap"""
-    return capacity - fuel_remain + fuel_consumption
-
-
-def end_stint_pit_counts(amount_need, capacity):
-    """Estimate end-stint pit stop counts"""
+        est_runlaps = amount_curr / used_est
+    else:
+        amount_left = 0
+        est_runlaps = 0
+    est_runmins = est_runlaps * laptime_last / 60
+    est_empty = capacity - total_fuel + used_lap_est
     # Pit counts = required fuel / empty capacity
-    return amount_need / capacity
-
-
-def end_lap_pit_counts(amount_need, est_empty, capacity):
-    """Estimate end-lap pit stop counts"""
+    capacity_left = capacity - amount_left
+    est_pits_late = amount_need / capacity_left
     # Amount fuel can be added without exceeding capacity
     max_add_curr = min(amount_need, est_empty)
     # Pit count of current stint, 1 if exceed empty capacity or no empty space
     est_pits_curr = max_add_curr / est_empty if est_empty else 1
     # Pit counts after current stint
-    est_pits_end = (amount_need - max_add_curr) / capacity
-    # Total pit counts add together
-    return est_pits_curr + est_pits_end
-
-
-def less_pit_stop_consumption(est_pits_late, capacity, amount_curr, laps_left):
-    """Estimate fuel consumption for one less pit stop"""
+    est_pits_early = est_pits_curr + (amount_need - max_add_curr) / capacity_left
+    # Consumption = total fuel / laps
     if laps_left:
         pit_counts = math.ceil(est_pits_late) - 1
-        # Consumption = total fuel / laps
-        return (pit_counts * capacity + amount_curr) / laps_left
-    return 0
+        used_est_less = (pit_counts * capacity + amount_curr) / laps_left
+    else:
+        used_est_less = 0
+    return (amount_left, est_runlaps, est_runmins, est_empty,
+            est_pits_late, est_pits_early, used_est_less)
@@ -22,14 +22,17 @@ Sectors module
 
 import logging
 import threading
+from array import array
 
 from ..module_info import minfo
 from ..api_control import api
+from .. import calculation as calc
 from .. import formatter as fmt
 from .. import validator as val
 
 MODULE_NAME = "module_sectors"
 MAGIC_NUM = 99999  # magic number for default variable not updated by rF2
+SECTOR_INDEX_OUTPUT = 0, 0, 1, 2  # output sector index, indexed by recorded index + 1
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +67,7 @@ class Realtime:
         active_interval = self.mcfg["update_interval"] / 1000
         idle_interval = self.mcfg["idle_update_interval"] / 1000
         update_interval = active_interval
+        bound_read = None  # API reader that read_* methods are bound to
 
         while not self.event.wait(update_interval):
             if api.state:
@@ -72,96 +76,64 @@ class Realtime:
                     reset = True
                     update_interval = active_interval
 
-                    last_sector_idx = -1  # previous recorded sector index value
+                    last_sector_idx = -1  # previous recorded sector index value, -1 to 2
                     combo_id = api.read.check.combo_id()  # current car & track combo
                     session_id = api.read.check.session_id()  # session identity
                     laptime_best, best_s_tb, best_s_pb = self.load_sector_data(
                         combo_id, session_id)
-                    delta_s_tb = [0,0,0]  # deltabest times against all time best sector
-                    delta_s_pb = [0,0,0]  # deltabest times against best laptime sector
-                    prev_s = [MAGIC_NUM,MAGIC_NUM,MAGIC_NUM]  # previous sector times
+                    delta_s_tb = array("d", [0,0,0])  # deltabest times against all time best sector
+                    delta_s_pb = array("d", [0,0,0])  # deltabest times against best laptime sector
+                    prev_s = array("d", [MAGIC_NUM,MAGIC_NUM,MAGIC_NUM])  # previous sector times
                     no_delta_s = True
+                    stall_ticks = 0  # consecutive ticks while in garage
+
+                # Bind API reader methods, rebind if reader replaced by API restart
+                read = api.read
+                if read is not bound_read:
+                    bound_read = read
+                    read_sector_idx = read.lap.sector_index
+                    read_last = read.timing.last_laptime
+                    read_curr_s1 = read.timing.current_sector1
+                    read_curr_s2 = read.timing.current_sector2
+                    read_last_s2 = read.timing.last_sector2
+                    read_garage = read.vehicle.in_garage
 
                 # Read telemetry
-                sector_idx = api.read.lap.sector_index()
-                laptime_valid = api.read.timing.last_laptime()
-                curr_sector1 = api.read.timing.current_sector1()
-                curr_sector2 = api.read.timing.current_sector2()
-                last_sector2 = api.read.timing.last_sector2()
+                sector_idx = read_sector_idx()
+                laptime_valid = read_last()
+                curr_sector1 = read_curr_s1()
+                curr_sector2 = read_curr_s2()
+                last_sector2 = read_last_s2()
+
+                # Back off update interval while in garage
+                if read_garage():
+                    stall_ticks += 1
+                else:
+                    stall_ticks = 0
+                update_interval = calc.backoff_interval(active_interval, stall_ticks)
 
                 # Update previous & best sector time
-                if last_sector_idx != sector_idx:  # keep checking until conditions met
+                if last_sector_idx != sector_idx and 0 <= sector_idx <= 2:
+                    # Keep checking until previous sector time is available
+                    sector_time = PREV_SECTOR_TIME[sector_idx](
+                        laptime_valid, curr_sector1, curr_sector2, last_sector2)
 
-                    # While vehicle in S1, update S3 data
-                    if sector_idx == 0 and laptime_valid > 0 and last_sector2 > 0:
+                    if sector_time > 0:
                         last_sector_idx = sector_idx  # reset & stop checking
+                        prev_s_idx = PREV_SECTOR_INDEX[sector_idx]
 
-                        prev_s[2] = laptime_valid - last_sector2
-
-                        # Update (time gap) deltabest bestlap sector 3 text
-                        if val.sector_time(best_s_pb[2]):
-                            delta_s_pb[2] = prev_s[2] - best_s_pb[2] + delta_s_pb[1]
-
-                        # Update deltabest sector 3 text
-                        if val.sector_time(best_s_tb[2]):
-                            delta_s_tb[2] = prev_s[2] - best_s_tb[2]
-                            no_delta_s = False
-                        else:
-                            no_delta_s = True
-
-                        # Save best sector 3 time
-                        if prev_s[2] < best_s_tb[2]:
-                            best_s_tb[2] = prev_s[2]
+                        no_delta_s = update_sector_time(
+                            prev_s_idx, sector_time,
+                            prev_s, best_s_tb, best_s_pb, delta_s_tb, delta_s_pb)
 
                         # Save sector time from personal best laptime
-                        if laptime_valid < laptime_best and val.sector_time(prev_s):
+                        if (prev_s_idx == 2 and laptime_valid < laptime_best
+                            and val.sector_time(prev_s)):
                             laptime_best = laptime_valid
-                            best_s_pb = prev_s.copy()
-
-                    # While vehicle in S2, update S1 data
-                    elif sector_idx == 1 and curr_sector1 > 0:
-                        last_sector_idx = sector_idx  # reset
-
-                        prev_s[0] = curr_sector1
-
-                        # Update (time gap) deltabest bestlap sector 1 text
-                        if val.sector_time(best_s_pb[0]):
-                            delta_s_pb[0] = prev_s[0] - best_s_pb[0]
-
-                        # Update deltabest sector 1 text
-                        if val.sector_time(best_s_tb[0]):
-                            delta_s_tb[0] = prev_s[0] - best_s_tb[0]
-                            no_delta_s = False
-                        else:
-                            no_delta_s = True
-
-                        # Save best sector 1 time
-                        if prev_s[0] < best_s_tb[0]:
-                            best_s_tb[0] = prev_s[0]
-
-                    # While vehicle in S3, update S2 data
-                    elif sector_idx == 2 and curr_sector2 > 0 and curr_sector1 > 0:
-                        last_sector_idx = sector_idx  # reset
-
-                        prev_s[1] = curr_sector2 - curr_sector1
-
-                        # Update (time gap) deltabest bestlap sector 2 text
-                        if val.sector_time(best_s_pb[1]):
-                            delta_s_pb[1] = prev_s[1] - best_s_pb[1] + delta_s_pb[0]
-
-                        # Update deltabest sector 2 text
-                        if val.sector_time(best_s_tb[1]):
-                            delta_s_tb[1] = prev_s[1] - best_s_tb[1]
-                            no_delta_s = False
-                        else:
-                            no_delta_s = True
-
-                        # Save best sector 2 time
-                        if prev_s[1] < best_s_tb[1]:
-                            best_s_tb[1] = prev_s[1]
+                            best_s_pb[:] = prev_s
 
                 # Output sectors data
-                minfo.sectors.sectorIndex = min(max(last_sector_idx, 0), 2)
+                minfo.sectors.sectorIndex = SECTOR_INDEX_OUTPUT[last_sector_idx + 1]
                 minfo.sectors.deltaSectorBestPB = delta_s_pb
                 minfo.sectors.deltaSectorBestTB = delta_s_tb
                 minfo.sectors.sectorBestTB = best_s_tb
@@ -205,36 +177,80 @@ class Realtime:
             saved_data[3] <= session_id[2]):
             # Assign loaded data
             laptime_best = saved_data[4]  # best laptime (seconds)
-            best_s_tb = saved_data[5]     # theory best sector times
-            best_s_pb = saved_data[6]     # personal best sector times
+            best_s_tb = array("d", saved_data[5])  # theory best sector times
+            best_s_pb = array("d", saved_data[6])  # personal best sector times
         else:
             logger.info("MISSING: sectors data")
             laptime_best = MAGIC_NUM
-            best_s_tb = [MAGIC_NUM,MAGIC_NUM,MAGIC_NUM]
-            best_s_pb = [MAGIC_NUM,MAGIC_NUM,MAGIC_NUM]
+            best_s_tb = array("d", [MAGIC_NUM,MAGIC_NUM,MAGIC_NUM])
+            best_s_pb = array("d", [MAGIC_NUM,MAGIC_NUM,MAGIC_NUM])
         return laptime_best, best_s_tb, best_s_pb
 
-    def parse_save_string(self, save_data):
+    @staticmethod
+    def parse_save_string(save_data):
         """Parse last saved sector data"""
-        string_list = fmt.pipe_split(save_data)
-        data = self.convert_value(string_list)
-
         try:  # fill in data
+            combo_name, *string_list = save_data.split("|")
+            (session_stamp, session_etime, session_tlaps, laptime_best,
+             tb_s1, tb_s2, tb_s3, pb_s1, pb_s2, pb_s3) = map(float, string_list[:10])
             final_list = [
-                data[0],                    # 0 - combo name, str
-                data[1],                    # 1 - session identify, float
-                data[2],                    # 2 - session elapsed time, float
-                data[3],                    # 3 - session total laps, float
-                data[4],                    # 4 - laptime_best, float
-                [data[5],data[6],data[7]],  # 5 - best_s_tb, float
-                [data[8],data[9],data[10]]  # 6 - best_s_pb, float
+                combo_name,              # 0 - combo name, str
+                session_stamp,           # 1 - session identify, float
+                session_etime,           # 2 - session elapsed time, float
+                session_tlaps,           # 3 - session total laps, float
+                laptime_best,            # 4 - laptime_best, float
+                [tb_s1, tb_s2, tb_s3],   # 5 - best_s_tb, float
+                [pb_s1, pb_s2, pb_s3]    # 6 - best_s_pb, float
             ]
-        except IndexError:  # reset data
+        except ValueError:  # reset data
             final_list = ["None"]
 
         return final_list
 
-    @staticmethod
-    def convert_value(string_list):
-        """Convert string list to str, float"""
-        return string_list[0], *tuple(map(float, string_list[1:]))
+
+def prev_sector3_time(laptime_valid, curr_sector1, curr_sector2, last_sector2):
+    """Sector 3 time, while vehicle in S1"""
+    if laptime_valid > 0 and last_sector2 > 0:
+        return laptime_valid - last_sector2
+    return 0
+
+
+def prev_sector1_time(laptime_valid, curr_sector1, curr_sector2, last_sector2):
+    """Sector 1 time, while vehicle in S2"""
+    return curr_sector1
+
+
+def prev_sector2_time(laptime_valid, curr_sector1, curr_sector2, last_sector2):
+    """Sector 2 time, while vehicle in S3"""
+    if curr_sector2 > 0 and curr_sector1 > 0:
+        return curr_sector2 - curr_sector1
+    return 0
+
+
+# Previous sector time function & index, indexed by current sector index
+PREV_SECTOR_TIME = prev_sector3_time, prev_sector1_time, prev_sector2_time
+PREV_SECTOR_INDEX = 2, 0, 1
+
+
+def update_sector_time(sec_idx, sector_time, prev_s, best_s_tb, best_s_pb,
+                       delta_s_tb, delta_s_pb):
+    """Update previous, best & delta sector time, return no delta sector state"""
+    prev_s[sec_idx] = sector_time
+
+    # Update (time gap) deltabest bestlap sector text
+    if val.sector_time(best_s_pb[sec_idx]):
+        delta_s_pb[sec_idx] = sector_time - best_s_pb[sec_idx]
+        if sec_idx > 0:  # accumulate from previous sector
+            delta_s_pb[sec_idx] += delta_s_pb[sec_idx - 1]
+
+    # Update deltabest sector text
+    if val.sector_time(best_s_tb[sec_idx]):
+        delta_s_tb[sec_idx] = sector_time - best_s_tb[sec_idx]
+        no_delta_s = False
+    else:
+        no_delta_s = True
+
+    # Save best sector time
+    if sector_time < best_s_tb[sec_idx]:
+        best_s_tb[sec_idx] = sector_time
+    return no_delta_s
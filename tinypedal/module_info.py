@@ -50,23 +50,40 @@ class ForceInfo:
     downForceRatio: float = 0
 
 
-@dataclass
 class FuelInfo:
     """Fuel module output data"""
-    tankCapacity: float = 0
-    amountFuelStart: float = 0
-    amountFuelCurrent: float = 0
-    amountFuelNeeded: float = 0
-    amountFuelBeforePitstop: float = 0
-    lastLapFuelConsumption: float = 0
-    estimatedFuelConsumption: float = 0
-    estimatedLaps: float = 0
-    estimatedMinutes: float = 0
-    estimatedEmptyCapacity: float = 0
-    estimatedNumPitStopsEnd: float = 0
-    estimatedNumPitStopsEarly: float = 0
-    deltaFuelConsumption: float = 0
-    oneLessPitFuelConsumption: float = 0
+    __slots__ = (
+        "tankCapacity",
+        "amountFuelStart",
+        "amountFuelCurrent",
+        "amountFuelNeeded",
+        "amountFuelBeforePitstop",
+        "lastLapFuelConsumption",
+        "estimatedFuelConsumption",
+        "estimatedLaps",
+        "estimatedMinutes",
+        "estimatedEmptyCapacity",
+        "estimatedNumPitStopsEnd",
+        "estimatedNumPitStopsEarly",
+        "deltaFuelConsumption",
+        "oneLessPitFuelConsumption",
+    )
+
+    def __init__(self):
+        self.tankCapacity: float = 0
+        self.amountFuelStart: float = 0
+        self.amountFuelCurrent: float = 0
+        self.amountFuelNeeded: float = 0
+        self.amountFuelBeforePitstop: float = 0
+        self.lastLapFuelConsumption: float = 0
+        self.estimatedFuelConsumption: float = 0
+        self.estimatedLaps: float = 0
+        self.estimatedMinutes: float = 0
+        self.estimatedEmptyCapacity: float = 0
+        self.estimatedNumPitStopsEnd: float = 0
+        self.estimatedNumPitStopsEarly: float = 0
+        self.deltaFuelConsumption: float = 0
+        self.oneLessPitFuelConsumption: float = 0
 
 
 @dataclass
@@ -100,16 +117,26 @@ class RelativeInfo:
     classes: list = None
 
 
-@dataclass
 class SectorsInfo:
     """Sectors module output data"""
-    sectorIndex: int = -1
-    deltaSectorBestPB: list = None
-    deltaSectorBestTB: list = None
-    sectorBestTB: list = None
-    sectorBestPB: list = None
-    sectorPrev: list = None
-    noDeltaSector: bool = True
+    __slots__ = (
+        "sectorIndex",
+        "deltaSectorBestPB",
+        "deltaSectorBestTB",
+        "sectorBestTB",
+        "sectorBestPB",
+        "sectorPrev",
+        "noDeltaSector",
+    )
+
+    def __init__(self):
+        self.sectorIndex: int = -1
+        self.deltaSectorBestPB: list = None
+        self.deltaSectorBestTB: list = None
+        self.sectorBestTB: list = None
+        self.sectorBestPB: list = None
+        self.sectorPrev: list = None
+        self.noDeltaSector: bool = True
 
 
 @dataclass
@@ -24,6 +24,7 @@ import logging
 import os
 import re
 import math
+from array import array
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -51,7 +52,7 @@ def cbytes2str(bytestring: any, char_encoding: str = "utf-8") -> str:
 
 def sector_time(sec_time: any, magic_num: int = 99999) -> bool:
     """Validate sector time"""
-    if isinstance(sec_time, list):
+    if isinstance(sec_time, (list, tuple, array)):
         return magic_num not in sec_time
     return magic_num != sec_time
 
@@ -20,7 +20,7 @@
 Brake pressure Widget
 """
 
-from PySide2.QtCore import Qt, Slot, QRectF
+from PySide2.QtCore import Qt, Slot, QRect, QRectF
 from PySide2.QtGui import QPainter, QPen, QColor
 
 from ..api_control import api
@@ -60,12 +60,49 @@ class Draw(Widget):
             self.bar_height * 2 + self.bar_gap
         )
 
+        # Background size
+        self.rect_bg_fl = QRectF(
+            0,
+            0,
+            self.bar_width,
+            self.bar_height
+        )
+        self.rect_bg_fr = QRectF(
+            self.bar_width + self.bar_gap,
+            0,
+            self.bar_width,
+            self.bar_height
+        )
+        self.rect_bg_rl = QRectF(
+            0,
+            self.bar_height + self.bar_gap,
+            self.bar_width,
+            self.bar_height
+        )
+        self.rect_bg_rr = QRectF(
+            self.bar_width + self.bar_gap,
+            self.bar_height + self.bar_gap,
+            self.bar_width,
+            self.bar_height
+        )
+        self.rect_bg_all = (self.rect_bg_fl, self.rect_bg_fr, self.rect_bg_rl, self.rect_bg_rr)
+        self.rect_update_all = tuple(rect.toAlignedRect() for rect in self.rect_bg_all)
+
+        # Text size
+        self.rect_text_fl = self.rect_bg_fl.adjusted(self.padx, self.font_offset, 0, 0)
+        self.rect_text_fr = self.rect_bg_fr.adjusted(0, self.font_offset, -self.padx, 0)
+        self.rect_text_rl = self.rect_bg_rl.adjusted(self.padx, self.font_offset, 0, 0)
+        self.rect_text_rr = self.rect_bg_rr.adjusted(0, self.font_offset, -self.padx, 0)
+
         self.pen = QPen()
         self.pen.setColor(QColor(self.wcfg["font_color"]))
+        self.bkg_color = QColor(self.wcfg["bkg_color"])
+        self.highlight_color = QColor(self.wcfg["highlight_color"])
 
         # Last data
-        self.bpres = [0] * 4
-        self.last_bpres = [None] * 4
+        self.bpres = (0,) * 4
+        self.bpres_text = ("0",) * 4
+        self.last_bpres = (None,) * 4
 
         # Set widget state & start update
         self.set_widget_state()
@@ -75,16 +112,29 @@ class Draw(Widget):
         """Update when vehicle on track"""
         if self.wcfg["enable"] and api.state:
 
-            # Brake pressure
-            self.bpres = tuple(map(self.brake_pressure_units, api.read.brake.pressure()))
+            # Brake pressure, rounded to integer percentage to match displayed text
+            raw_bpres = api.read.brake.pressure()
+            self.bpres = (
+                round(raw_bpres[0] * 100),
+                round(raw_bpres[1] * 100),
+                round(raw_bpres[2] * 100),
+                round(raw_bpres[3] * 100),
+            )
             self.update_bpres(self.bpres, self.last_bpres)
             self.last_bpres = self.bpres
 
     # GUI update methods
     def update_bpres(self, curr, last):
         """Brake pressure"""
-        if curr != last:
-            self.update()
+        if curr == last:
+            return
+        self.bpres_text = tuple(f"{value:.0f}" for value in curr)
+        # Only repaint changed wheel area
+        update_rect = QRect()
+        for rect, value, last_value in zip(self.rect_update_all, curr, last):
+            if value != last_value:
+                update_rect = update_rect.united(rect)
+        self.update(update_rect)
 
     def paintEvent(self, event):
         """Draw"""
@@ -96,97 +146,64 @@ class Draw(Widget):
 
     def draw_brake_pressure(self, painter):
         """Brake pressure"""
-        # Background size
-        rect_bg_fl = QRectF(
-            0,
-            0,
-            self.bar_width,
-            self.bar_height
-        )
-        rect_bg_fr = QRectF(
-            self.bar_width + self.bar_gap,
-            0,
-            self.bar_width,
-            self.bar_height
-        )
-        rect_bg_rl = QRectF(
-            0,
-            self.bar_height + self.bar_gap,
-            self.bar_width,
-            self.bar_height
-        )
-        rect_bg_rr = QRectF(
-            self.bar_width + self.bar_gap,
-            self.bar_height + self.bar_gap,
-            self.bar_width,
-            self.bar_height
-        )
         # Brake pressure size
+        width_fl = self.bpres[0] * self.width_scale
+        width_fr = self.bpres[1] * self.width_scale
+        width_rl = self.bpres[2] * self.width_scale
+        width_rr = self.bpres[3] * self.width_scale
         rect_bpres_fl = QRectF(
-            self.bar_width - self.bpres[0] * self.width_scale,
+            self.bar_width - width_fl,
             0,
-            self.bpres[0] * self.width_scale,
+            width_fl,
             self.bar_height
         )
         rect_bpres_fr = QRectF(
             self.bar_width + self.bar_gap,
             0,
-            self.bpres[1] * self.width_scale,
+            width_fr,
             self.bar_height
         )
         rect_bpres_rl = QRectF(
-            self.bar_width - self.bpres[2] * self.width_scale,
+            self.bar_width - width_rl,
             self.bar_height + self.bar_gap,
-            self.bpres[2] * self.width_scale,
+            width_rl,
             self.bar_height
         )
         rect_bpres_rr = QRectF(
             self.bar_width + self.bar_gap,
             self.bar_height + self.bar_gap,
-            self.bpres[3] * self.width_scale,
+            width_rr,
             self.bar_height
         )
 
         # Update background
         painter.setPen(Qt.NoPen)
-        bkg_color = QColor(self.wcfg["bkg_color"])
-        painter.fillRect(rect_bg_fl, bkg_color)
-        painter.fillRect(rect_bg_fr, bkg_color)
-        painter.fillRect(rect_bg_rl, bkg_color)
-        painter.fillRect(rect_bg_rr, bkg_color)
-
-        hi_color = QColor(self.wcfg["highlight_color"])
-        painter.fillRect(rect_bpres_fl, hi_color)
-        painter.fillRect(rect_bpres_fr, hi_color)
-        painter.fillRect(rect_bpres_rl, hi_color)
-        painter.fillRect(rect_bpres_rr, hi_color)
+        painter.setBrush(self.bkg_color)
+        painter.drawRects(self.rect_bg_all)
+
+        painter.setBrush(self.highlight_color)
+        painter.drawRects((rect_bpres_fl, rect_bpres_fr, rect_bpres_rl, rect_bpres_rr))
 
         # Update text
         painter.setPen(self.pen)
         painter.setFont(self.font)
         painter.drawText(
-            rect_bg_fl.adjusted(self.padx, self.font_offset, 0, 0),
+            self.rect_text_fl,
             Qt.AlignLeft | Qt.AlignVCenter,
-            f"{self.bpres[0]:.0f}"
+            self.bpres_text[0]
         )
         painter.drawText(
-            rect_bg_fr.adjusted(0, self.font_offset, -self.padx, 0),
+            self.rect_text_fr,
             Qt.AlignRight | Qt.AlignVCenter,
-            f"{self.bpres[1]:.0f}"
+            self.bpres_text[1]
         )
         painter.drawText(
-            rect_bg_rl.adjusted(self.padx, self.font_offset, 0, 0),
+            self.rect_text_rl,
             Qt.AlignLeft | Qt.AlignVCenter,
-            f"{self.bpres[2]:.0f}"
+            self.bpres_text[2]
         )
         painter.drawText(
-            rect_bg_rr.adjusted(0, self.font_offset, -self.padx, 0),
+            self.rect_text_rr,
             Qt.AlignRight | Qt.AlignVCenter,
-            f"{self.bpres[3]:.0f}"
+            self.bpres_text[3]
         )
-
-    # Additional methods
-    @staticmethod
-    def brake_pressure_units(value):
-        """Brake pressure percentage"""
-        return round(value * 100, 1)
@@ -20,8 +20,8 @@
 Engine Widget
 """
 
-from PySide2.QtCore import Qt, Slot
-from PySide2.QtWidgets import QGridLayout, QLabel
+from PySide2.QtCore import Qt, Slot, QRect
+from PySide2.QtGui import QPainter, QPen, QColor
 
 from .. import calculation as calc
 from ..api_control import api
@@ -38,92 +38,104 @@ class Draw(Widget):
         Widget.__init__(self, config, WIDGET_NAME)
 
         # Config font
-        font_m = self.get_font_metrics(
-            self.config_font(self.wcfg["font_name"], self.wcfg["font_size"]))
+        self.font = self.config_font(
+            self.wcfg["font_name"],
+            self.wcfg["font_size"],
+            self.wcfg["font_weight"]
+        )
+        font_m = self.get_font_metrics(self.font)
 
         # Config variable
         bar_padx = round(self.wcfg["font_size"] * self.wcfg["bar_padding"])
         bar_gap = self.wcfg["bar_gap"]
-        self.bar_width = font_m.width * 8
-
-        # Base style
-        self.setStyleSheet(
-            f"font-family: {self.wcfg['font_name']};"
-            f"font-size: {self.wcfg['font_size']}px;"
-            f"font-weight: {self.wcfg['font_weight']};"
-            f"padding: 0 {bar_padx}px;"
-        )
+        bar_width = font_m.width * 8 + bar_padx * 2
+        bar_height = font_m.height
+        self.show_temperature = self.wcfg["show_temperature"]
+        self.show_turbo_pressure = self.wcfg["show_turbo_pressure"]
+        self.show_rpm = self.wcfg["show_rpm"]
+        self.overheat_threshold_oil = self.wcfg["overheat_threshold_oil"]
+        self.overheat_threshold_water = self.wcfg["overheat_threshold_water"]
+
+        # Config units
+        if self.cfg.units["temperature_unit"] == "Fahrenheit":
+            self.temp_units = calc.celsius2fahrenheit
+        else:
+            self.temp_units = self.temp_celsius
 
-        # Create layout
-        layout = QGridLayout()
-        layout.setContentsMargins(0,0,0,0)  # remove border
-        layout.setSpacing(bar_gap)
-        layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        if self.cfg.units["turbo_pressure_unit"] == "psi":
+            self.pressure_units = self.pressure_psi
+        elif self.cfg.units["turbo_pressure_unit"] == "kPa":
+            self.pressure_units = self.pressure_kpa
+        else:
+            self.pressure_units = self.pressure_bar
+
+        # Bar order
+        bar_list = []
+        if self.show_temperature:
+            bar_list.append((self.wcfg["column_index_oil"], "oil"))
+            bar_list.append((self.wcfg["column_index_water"], "water"))
+        if self.show_turbo_pressure:
+            bar_list.append((self.wcfg["column_index_turbo"], "turbo"))
+        if self.show_rpm:
+            bar_list.append((self.wcfg["column_index_rpm"], "rpm"))
+        bar_list.sort(key=lambda bar: bar[0])
+
+        # Bar rect
+        bar_rect = {}
+        for index, (_, bar_name) in enumerate(bar_list):
+            if self.wcfg["layout"] == 0:
+                # Vertical layout
+                bar_rect[bar_name] = QRect(
+                    0, (bar_height + bar_gap) * index, bar_width, bar_height)
+            else:
+                # Horizontal layout
+                bar_rect[bar_name] = QRect(
+                    (bar_width + bar_gap) * index, 0, bar_width, bar_height)
 
-        column_oil = self.wcfg["column_index_oil"]
-        column_water = self.wcfg["column_index_water"]
-        column_turbo = self.wcfg["column_index_turbo"]
-        column_rpm = self.wcfg["column_index_rpm"]
+        # Config canvas
+        bar_count = max(len(bar_list), 1)
+        if self.wcfg["layout"] == 0:
+            self.resize(bar_width, bar_height * bar_count + bar_gap * (bar_count - 1))
+        else:
+            self.resize(bar_width * bar_count + bar_gap * (bar_count - 1), bar_height)
+
+        self.pen = QPen()
+
+        # Bar (rect, text, font color, background color)
+        self.bar_all = []
 
         # Oil temperature
-        if self.wcfg["show_temperature"]:
-            self.bar_oil = QLabel("Oil T")
-            self.bar_oil.setAlignment(Qt.AlignCenter)
-            self.bar_oil.setStyleSheet(
-                f"color: {self.wcfg['font_color_oil']};"
-                f"background: {self.wcfg['bkg_color_oil']};"
-                f"min-width: {self.bar_width}px;"
-            )
+        if self.show_temperature:
+            self.bkg_oil = QColor(self.wcfg["bkg_color_oil"])
+            self.bkg_oil_overheat = QColor(self.wcfg["warning_color_overheat"])
+            self.bar_oil = [
+                bar_rect["oil"], "Oil T",
+                QColor(self.wcfg["font_color_oil"]), self.bkg_oil]
+            self.bar_all.append(self.bar_oil)
 
             # Water temperature
-            self.bar_water = QLabel("Water T")
-            self.bar_water.setAlignment(Qt.AlignCenter)
-            self.bar_water.setStyleSheet(
-                f"color: {self.wcfg['font_color_water']};"
-                f"background: {self.wcfg['bkg_color_water']};"
-                f"min-width: {self.bar_width}px;"
-            )
+            self.bkg_water = QColor(self.wcfg["bkg_color_water"])
+            self.bkg_water_overheat = QColor(self.wcfg["warning_color_overheat"])
+            self.bar_water = [
+                bar_rect["water"], "Water T",
+                QColor(self.wcfg["font_color_water"]), self.bkg_water]
+            self.bar_all.append(self.bar_water)
 
         # Turbo pressure
-        if self.wcfg["show_turbo_pressure"]:
-            self.bar_turbo = QLabel("Turbo")
-            self.bar_turbo.setAlignment(Qt.AlignCenter)
-            self.bar_turbo.setStyleSheet(
-                f"color: {self.wcfg['font_color_turbo']};"
-                f"background: {self.wcfg['bkg_color_turbo']};"
-                f"min-width: {self.bar_width}px;"
-            )
+        if self.show_turbo_pressure:
+            self.bar_turbo = [
+                bar_rect["turbo"], "Turbo",
+                QColor(self.wcfg["font_color_turbo"]),
+                QColor(self.wcfg["bkg_color_turbo"])]
+            self.bar_all.append(self.bar_turbo)
 
         # RPM
-        if self.wcfg["show_rpm"]:
-            self.bar_rpm = QLabel("RPM")
-            self.bar_rpm.setAlignment(Qt.AlignCenter)
-            self.bar_rpm.setStyleSheet(
-                f"color: {self.wcfg['font_color_rpm']};"
-                f"background: {self.wcfg['bkg_color_rpm']};"
-                f"min-width: {self.bar_width}px;"
-            )
-
-        # Set layout
-        if self.wcfg["layout"] == 0:
-            # Vertical layout
-            if self.wcfg["show_temperature"]:
-                layout.addWidget(self.bar_oil, column_oil, 0)
-                layout.addWidget(self.bar_water, column_water, 0)
-            if self.wcfg["show_turbo_pressure"]:
-                layout.addWidget(self.bar_turbo, column_turbo, 0)
-            if self.wcfg["show_rpm"]:
-                layout.addWidget(self.bar_rpm, column_rpm, 0)
-        else:
-            # Horizontal layout
-            if self.wcfg["show_temperature"]:
-                layout.addWidget(self.bar_oil, 0, column_oil)
-                layout.addWidget(self.bar_water, 0, column_water)
-            if self.wcfg["show_turbo_pressure"]:
-                layout.addWidget(self.bar_turbo, 0, column_turbo)
-            if self.wcfg["show_rpm"]:
-                layout.addWidget(self.bar_rpm, 0, column_rpm)
-        self.setLayout(layout)
+        if self.show_rpm:
+            self.bar_rpm = [
+                bar_rect["rpm"], "RPM",
+                QColor(self.wcfg["font_color_rpm"]),
+                QColor(self.wcfg["bkg_color_rpm"])]
+            self.bar_all.append(self.bar_rpm)
 
         # Last data
         self.last_temp_oil = None
@@ -139,82 +151,91 @@ class Draw(Widget):
         """Update when vehicle on track"""
         if self.wcfg["enable"] and api.state:
 
+            raw_oil, raw_water, raw_turbo, raw_rpm = api.read.engine.snapshot()
+
             # Temperature
-            if self.wcfg["show_temperature"]:
+            if self.show_temperature:
                 # Oil temperature
-                temp_oil = round(api.read.engine.oil_temperature(), 1)
-                self.update_oil(temp_oil, self.last_temp_oil)
+                temp_oil = round(raw_oil, 1)
+                self.update_temperature(
+                    temp_oil, self.last_temp_oil, self.bar_oil, "O",
+                    self.overheat_threshold_oil, self.bkg_oil, self.bkg_oil_overheat)
                 self.last_temp_oil = temp_oil
 
                 # Water temperature
-                temp_water = round(api.read.engine.water_temperature(), 1)
-                self.update_water(temp_water, self.last_temp_water)
+                temp_water = round(raw_water, 1)
+                self.update_temperature(
+                    temp_water, self.last_temp_water, self.bar_water, "W",
+                    self.overheat_threshold_water, self.bkg_water, self.bkg_water_overheat)
                 self.last_temp_water = temp_water
 
             # Turbo pressure
-            if self.wcfg["show_turbo_pressure"]:
-                turbo = int(api.read.engine.turbo())
+            if self.show_turbo_pressure:
+                turbo = self.pressure_units(raw_turbo * 0.001)
                 self.updatturbo(turbo, self.last_turbo)
                 self.last_turbo = turbo
 
             # Engine RPM
-            if self.wcfg["show_rpm"]:
-                rpm = int(api.read.engine.rpm())
+            if self.show_rpm:
+                rpm = int(raw_rpm)
                 self.updatrpm(rpm, self.last_rpm)
                 self.last_rpm = rpm
 
     # GUI update methods
-    def update_oil(self, curr, last):
-        """Oil temperature"""
+    def update_temperature(self, curr, last, bar, prefix, threshold, bkg, bkg_overheat):
+        """Oil & water temperature"""
         if curr != last:
-            if curr < self.wcfg["overheat_threshold_oil"]:
-                color = (f"color: {self.wcfg['font_color_oil']};"
-                         f"background: {self.wcfg['bkg_color_oil']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_oil']};"
-                         f"background: {self.wcfg['warning_color_overheat']};")
-
-            if self.cfg.units["temperature_unit"] == "Fahrenheit":
-                curr = calc.celsius2fahrenheit(curr)
-
-            format_text = f"{curr:.01f}°"[:7].rjust(7)
-            self.bar_oil.setText(f"O{format_text}")
-            self.bar_oil.setStyleSheet(
-                f"{color}min-width: {self.bar_width}px;")
-
-    def update_water(self, curr, last):
-        """Water temperature"""
-        if curr != last:
-            if curr < self.wcfg["overheat_threshold_water"]:
-                color = (f"color: {self.wcfg['font_color_water']};"
-                         f"background: {self.wcfg['bkg_color_water']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_water']};"
-                         f"background: {self.wcfg['warning_color_overheat']};")
-
-            if self.cfg.units["temperature_unit"] == "Fahrenheit":
-                curr = calc.celsius2fahrenheit(curr)
-
-            format_text = f"{curr:.01f}°"[:7].rjust(7)
-            self.bar_water.setText(f"W{format_text}")
-            self.bar_water.setStyleSheet(
-                f"{color}min-width: {self.bar_width}px;")
+            bar[1] = f"{prefix}{self.temp_units(curr):>6.1f}°"
+            bar[3] = bkg_overheat if curr >= threshold else bkg
+            self.update(bar[0])
 
     def updatturbo(self, curr, last):
         """Turbo pressure"""
         if curr != last:
-            self.bar_turbo.setText(self.pressure_units(curr * 0.001))
+            self.bar_turbo[1] = curr
+            self.update(self.bar_turbo[0])
 
     def updatrpm(self, curr, last):
         """Engine RPM"""
         if curr != last:
-            self.bar_rpm.setText(f"{curr: =05.0f}rpm")
+            self.bar_rpm[1] = f"{curr: =05.0f}rpm"
+            self.update(self.bar_rpm[0])
+
+    def paintEvent(self, event):
+        """Draw"""
+        painter = QPainter(self)
+        painter.setFont(self.font)
+
+        # Draw engine bars
+        self.draw_engine(painter, event.rect())
+
+    def draw_engine(self, painter, update_rect):
+        """Engine bars, skip bars outside of update area"""
+        for rect, text, fg_color, bg_color in self.bar_all:
+            if not update_rect.intersects(rect):
+                continue
+            painter.fillRect(rect, bg_color)
+            self.pen.setColor(fg_color)
+            painter.setPen(self.pen)
+            painter.drawText(rect, Qt.AlignCenter, text)
 
     # Additional methods
-    def pressure_units(self, pres):
-        """Pressure units"""
-        if self.cfg.units["turbo_pressure_unit"] == "psi":
-            return f"{calc.kpa2psi(pres):03.02f}psi"
-        if self.cfg.units["turbo_pressure_unit"] == "kPa":
-            return f"{pres:03.01f}kPa"
+    @staticmethod
+    def temp_celsius(temp):
+        """Temperature in Celsius"""
+        return temp
+
+    @staticmethod
+    def pressure_psi(pres):
+        """Pressure in psi"""
+        return f"{calc.kpa2psi(pres):03.02f}psi"
+
+    @staticmethod
+    def pressure_kpa(pres):
+        """Pressure in kPa"""
+        return f"{pres:03.01f}kPa"
+
+    @staticmethod
+    def pressure_bar(pres):
+        """Pressure in bar"""
         return f"{calc.kpa2bar(pres):03.03f}bar"
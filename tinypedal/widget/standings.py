@@ -30,6 +30,7 @@ from ..base import Widget
 from ..module_info import minfo
 
 WIDGET_NAME = "standings"
+EMPTY_LAPTIME = "-:--.---"
 
 
 class Draw(Widget):
@@ -53,6 +54,17 @@ class Draw(Widget):
         self.int_width = max(int(self.wcfg["time_interval_width"]), 1)
         self.gap_decimals = max(int(self.wcfg["time_gap_decimal_places"]), 0)
         self.int_decimals = max(int(self.wcfg["time_interval_decimal_places"]), 0)
+        self.gap_format = f"{{:.{self.gap_decimals}f}}".format
+        self.int_format = f"{{:.{self.int_decimals}f}}".format
+        self.gap_leader_text = self.wcfg["time_gap_leader_text"]
+        self.int_leader_text = self.wcfg["time_interval_leader_text"]
+        self.driver_name_uppercase = self.wcfg["driver_name_uppercase"]
+        self.vehicle_name_uppercase = self.wcfg["vehicle_name_uppercase"]
+        self.show_pit_request = self.wcfg["show_pit_request"]
+        self.show_time_gap_from_class_best = self.wcfg["show_time_gap_from_class_best"]
+        self.pit_status_text = self.wcfg["pit_status_text"]
+        self.split_gap = self.wcfg["split_gap"]
+        self.style_split_gap = f"max-height:{self.split_gap}px;"
 
         # Base style
         self.setStyleSheet(
@@ -71,19 +83,29 @@ class Draw(Widget):
         # Empty data set
         self.empty_vehicles_data = (
             0,  # is_player
-            (0,0),  # in_pit
-            ("",0),  # position
-            ("",0),  # driver name
-            ("",0),  # vehicle name
-            ("",0),  # pos_class
-            ("",0),  # veh_class
-            (0,0),  # tire_idx
-            ("",0),  # laptime
-            ("",0),  # time_gap
+            0,  # in_pit
+            "",  # position
+            "",  # driver name
+            "",  # vehicle name
+            "",  # pos_class
+            "",  # veh_class
+            0,  # tire_idx
+            "",  # laptime
+            "",  # time_gap
             (-1,0),  # pit_count
-            ("",0),  # time_int
+            "",  # time_int
         )
 
+        # Row bars & last data
+        self.rows = {}
+        self.last_style = {}
+        self.last_visible = {}
+        self.veh_cache = {}
+        self.last_data_source = (None, None, None)
+        self.class_style_cache = {}
+        self.tyre_cmp_cache = {}
+        self.last_veh = [[None] * len(self.empty_vehicles_data) for _ in range(self.veh_range)]
+
         # Create layout
         self.layout = QGridLayout()
         self.layout.setContentsMargins(0,0,0,0)  # remove border
@@ -106,72 +128,44 @@ class Draw(Widget):
         # Driver position
         if self.wcfg["show_position"]:
             self.bar_width_pos = f"min-width: {font_m.width * 2}px;"
-            bar_style_pos = (
-                f"color: {self.wcfg['font_color_position']};"
-                f"background: {self.wcfg['bkg_color_position']};"
-                f"{self.bar_width_pos}"
-            )
-            self.generate_bar("pos", bar_style_pos, column_pos)
+            self.style_pos = self.set_style_player("position", self.bar_width_pos)
+            self.generate_bar("pos", self.style_pos[0], column_pos)
 
         # Driver name
         if self.wcfg["show_driver_name"]:
             self.bar_width_drv = f"min-width: {font_m.width * self.drv_width}px;"
-            bar_style_drv = (
-                f"color: {self.wcfg['font_color_driver_name']};"
-                f"background: {self.wcfg['bkg_color_driver_name']};"
-                f"{self.bar_width_drv}"
-            )
-            self.generate_bar("drv", bar_style_drv, column_drv)
+            self.style_drv = self.set_style_player("driver_name", self.bar_width_drv)
+            self.generate_bar("drv", self.style_drv[0], column_drv)
 
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
             self.bar_width_veh = f"min-width: {font_m.width * self.veh_width}px;"
-            bar_style_veh = (
-                f"color: {self.wcfg['font_color_vehicle_name']};"
-                f"background: {self.wcfg['bkg_color_vehicle_name']};"
-                f"{self.bar_width_veh}"
-            )
-            self.generate_bar("veh", bar_style_veh, column_veh)
+            self.style_veh = self.set_style_player("vehicle_name", self.bar_width_veh)
+            self.generate_bar("veh", self.style_veh[0], column_veh)
 
         # Time gap
         if self.wcfg["show_time_gap"]:
             self.bar_width_gap = f"min-width: {font_m.width * self.gap_width}px;"
-            bar_style_gap = (
-                f"color: {self.wcfg['font_color_time_gap']};"
-                f"background: {self.wcfg['bkg_color_time_gap']};"
-                f"{self.bar_width_gap}"
-            )
-            self.generate_bar("gap", bar_style_gap, column_gap)
+            self.style_gap = self.set_style_player("time_gap", self.bar_width_gap)
+            self.generate_bar("gap", self.style_gap[0], column_gap)
 
         # Time interval
         if self.wcfg["show_time_interval"]:
             self.bar_width_int = f"min-width: {font_m.width * self.int_width}px;"
-            bar_style_int = (
-                f"color: {self.wcfg['font_color_time_interval']};"
-                f"background: {self.wcfg['bkg_color_time_interval']};"
-                f"{self.bar_width_int}"
-            )
-            self.generate_bar("int", bar_style_int, column_int)
+            self.style_int = self.set_style_player("time_interval", self.bar_width_int)
+            self.generate_bar("int", self.style_int[0], column_int)
 
         # Vehicle laptime
         if self.wcfg["show_laptime"]:
             self.bar_width_lpt = f"min-width: {font_m.width * 8}px;"
-            bar_style_lpt = (
-                f"color: {self.wcfg['font_color_laptime']};"
-                f"background: {self.wcfg['bkg_color_laptime']};"
-                f"{self.bar_width_lpt}"
-            )
-            self.generate_bar("lpt", bar_style_lpt, column_lpt)
+            self.style_lpt = self.set_style_player("laptime", self.bar_width_lpt)
+            self.generate_bar("lpt", self.style_lpt[0], column_lpt)
 
         # Vehicle position in class
         if self.wcfg["show_position_in_class"]:
             self.bar_width_pic = f"min-width: {font_m.width * 2}px;"
-            bar_style_pic = (
-                f"color: {self.wcfg['font_color_position_in_class']};"
-                f"background: {self.wcfg['bkg_color_position_in_class']};"
-                f"{self.bar_width_pic}"
-            )
-            self.generate_bar("pic", bar_style_pic, column_pic)
+            self.style_pic = self.set_style_player("position_in_class", self.bar_width_pic)
+            self.generate_bar("pic", self.style_pic[0], column_pic)
 
         # Vehicle class
         if self.wcfg["show_class"]:
@@ -186,32 +180,52 @@ class Draw(Widget):
         # Vehicle in pit
         if self.wcfg["show_pit_status"]:
             self.bar_width_pit = f"min-width: {font_m.width * len(self.wcfg['pit_status_text'])}px;"
-            bar_style_pit = (
+            self.style_pit = (
+                f"color: {self.wcfg['font_color_pit']};"
+                f"background: #00000000;"
+                f"{self.bar_width_pit}",
                 f"color: {self.wcfg['font_color_pit']};"
                 f"background: {self.wcfg['bkg_color_pit']};"
                 f"{self.bar_width_pit}"
             )
-            self.generate_bar("pit", bar_style_pit, column_pit)
+            self.generate_bar("pit", self.style_pit[1], column_pit)
 
         # Tyre compound index
         if self.wcfg["show_tyre_compound"]:
             self.bar_width_tcp = f"min-width: {font_m.width * 2}px;"
-            bar_style_tcp = (
-                f"color: {self.wcfg['font_color_tyre_compound']};"
-                f"background: {self.wcfg['bkg_color_tyre_compound']};"
-                f"{self.bar_width_tcp}"
-            )
-            self.generate_bar("tcp", bar_style_tcp, column_tcp)
+            self.style_tcp = self.set_style_player("tyre_compound", self.bar_width_tcp)
+            self.generate_bar("tcp", self.style_tcp[0], column_tcp)
 
         # Pitstop count
         if self.wcfg["show_pitstop_count"]:
             self.bar_width_psc = f"min-width: {font_m.width * 2}px;"
-            bar_style_psc = (
-                f"color: {self.wcfg['font_color_pitstop_count']};"
-                f"background: {self.wcfg['bkg_color_pitstop_count']};"
+            self.style_psc = self.set_style_player("pitstop_count", self.bar_width_psc)
+            self.style_psc_pit_request = (
+                f"color: {self.wcfg['font_color_pit_request']};"
+                f"background: {self.wcfg['bkg_color_pit_request']};"
                 f"{self.bar_width_psc}"
             )
-            self.generate_bar("psc", bar_style_psc, column_psc)
+            self.generate_bar("psc", self.style_psc[0], column_psc)
+
+        # Column update list: update method, row bars, vehicle data index
+        column_list = (
+            ("show_position", "pos", self.update_pos, 2),
+            ("show_driver_name", "drv", self.update_drv, 3),
+            ("show_vehicle_name", "veh", self.update_veh, 4),
+            ("show_time_gap", "gap", self.update_gap, 9),
+            ("show_time_interval", "int", self.update_int, 11),
+            ("show_laptime", "lpt", self.update_lpt, 8),
+            ("show_position_in_class", "pic", self.update_pic, 5),
+            ("show_class", "cls", self.update_cls, 6),
+            ("show_pit_status", "pit", self.update_pit, 1),
+            ("show_tyre_compound", "tcp", self.update_tcp, 7),
+            ("show_pitstop_count", "psc", self.update_psc, 10),
+        )
+        self.column_update = tuple(
+            (update_column, self.rows[suffix], data_idx)
+            for show_key, suffix, update_column, data_idx in column_list
+            if self.wcfg[show_key]
+        )
 
         # Set layout
         self.setLayout(self.layout)
@@ -221,332 +235,198 @@ class Draw(Widget):
 
     def generate_bar(self, suffix, style, column_idx):
         """Generate data bar"""
-        data_slots = len(self.empty_vehicles_data)
+        bar_list = []
         for idx in range(self.veh_range):
-            setattr(self, f"row_{idx}_{suffix}", QLabel(""))
-            getattr(self, f"row_{idx}_{suffix}").setAlignment(Qt.AlignCenter)
-            getattr(self, f"row_{idx}_{suffix}").setStyleSheet(style)
-            self.layout.addWidget(
-                getattr(self, f"row_{idx}_{suffix}"), idx, column_idx)
+            row_bar = QLabel("")
+            row_bar.setTextFormat(Qt.PlainText)
+            row_bar.setAlignment(Qt.AlignCenter)
             if idx > 0:  # show only first row initially
-                getattr(self, f"row_{idx}_{suffix}").setStyleSheet(
-                    f"max-height:{self.wcfg['split_gap']}px;"
-                )
-            # Last data
-            setattr(self, f"last_veh_{idx}", [None] * data_slots)
+                self.set_style(row_bar, self.style_split_gap)
+            else:
+                self.set_style(row_bar, style)
+            self.layout.addWidget(row_bar, idx, column_idx)
+            bar_list.append(row_bar)
+        self.rows[suffix] = bar_list
+
+    def set_style_player(self, name, bar_width):
+        """Set normal & player highlighted style, indexed by is_player"""
+        style_normal = (
+            f"color: {self.wcfg[f'font_color_{name}']};"
+            f"background: {self.wcfg[f'bkg_color_{name}']};"
+            f"{bar_width}"
+        )
+        if not self.wcfg["show_player_highlighted"]:
+            return style_normal, style_normal
+        style_player = (
+            f"color: {self.wcfg[f'font_color_player_{name}']};"
+            f"background: {self.wcfg[f'bkg_color_player_{name}']};"
+            f"{bar_width}"
+        )
+        return style_normal, style_player
 
     @Slot()
     def update_data(self):
         """Update when vehicle on track"""
-        if self.wcfg["enable"] and api.state and minfo.relative.standings:
+        if (self.wcfg["enable"] and api.state and minfo.relative.standings
+                and self.isVisible()):
 
             standings_idx = minfo.relative.standings
             vehicles_data = minfo.vehicles.dataSet
+            in_race = api.read.session.in_race()
+
+            # Skip if modules have not published new data since last update
+            last_source = self.last_data_source
+            if (standings_idx is last_source[0] and vehicles_data is last_source[1]
+                    and in_race == last_source[2]):
+                return
+            self.last_data_source = (standings_idx, vehicles_data, in_race)
             total_idx = len(standings_idx)
 
+            get_data = self.get_data
+            empty_data = self.empty_vehicles_data
+
             # Standings update
-            for idx in range(self.veh_range):
+            for idx, last_veh in enumerate(self.last_veh):
 
                 # Get vehicle data
                 if idx < total_idx:
-                    setattr(self, f"veh_{idx}",
-                            self.get_data(standings_idx[idx], vehicles_data)
-                            )
+                    veh = get_data(standings_idx[idx], vehicles_data, in_race)
                 else:  # bypass index out range
-                    setattr(self, f"veh_{idx}",
-                            self.empty_vehicles_data
-                            )
-                # Driver position
-                if self.wcfg["show_position"]:
-                    self.update_pos(f"{idx}_pos",
-                                    getattr(self, f"veh_{idx}")[2],
-                                    getattr(self, f"last_veh_{idx}")[2],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Driver name
-                if self.wcfg["show_driver_name"]:
-                    self.update_drv(f"{idx}_drv",
-                                    getattr(self, f"veh_{idx}")[3],
-                                    getattr(self, f"last_veh_{idx}")[3],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Vehicle name
-                if self.wcfg["show_vehicle_name"]:
-                    self.update_veh(f"{idx}_veh",
-                                    getattr(self, f"veh_{idx}")[4],
-                                    getattr(self, f"last_veh_{idx}")[4],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Time gap
-                if self.wcfg["show_time_gap"]:
-                    self.update_gap(f"{idx}_gap",
-                                    getattr(self, f"veh_{idx}")[9],
-                                    getattr(self, f"last_veh_{idx}")[9],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Time interval
-                if self.wcfg["show_time_interval"]:
-                    self.update_int(f"{idx}_int",
-                                    getattr(self, f"veh_{idx}")[11],
-                                    getattr(self, f"last_veh_{idx}")[11],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Vehicle laptime
-                if self.wcfg["show_laptime"]:
-                    self.update_lpt(f"{idx}_lpt",
-                                    getattr(self, f"veh_{idx}")[8],
-                                    getattr(self, f"last_veh_{idx}")[8],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Vehicle position in class
-                if self.wcfg["show_position_in_class"]:
-                    self.update_pic(f"{idx}_pic",
-                                    getattr(self, f"veh_{idx}")[5],
-                                    getattr(self, f"last_veh_{idx}")[5],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Vehicle class
-                if self.wcfg["show_class"]:
-                    self.update_cls(f"{idx}_cls",
-                                    getattr(self, f"veh_{idx}")[6],
-                                    getattr(self, f"last_veh_{idx}")[6]
-                                    )
-                # Vehicle in pit
-                if self.wcfg["show_pit_status"]:
-                    self.update_pit(f"{idx}_pit",
-                                    getattr(self, f"veh_{idx}")[1],
-                                    getattr(self, f"last_veh_{idx}")[1]
-                                    )
-                # Tyre compound index
-                if self.wcfg["show_tyre_compound"]:
-                    self.update_tcp(f"{idx}_tcp",
-                                    getattr(self, f"veh_{idx}")[7],
-                                    getattr(self, f"last_veh_{idx}")[7],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
-                # Pitstop count
-                if self.wcfg["show_pitstop_count"]:
-                    self.update_psc(f"{idx}_psc",
-                                    getattr(self, f"veh_{idx}")[10],
-                                    getattr(self, f"last_veh_{idx}")[10],
-                                    getattr(self, f"veh_{idx}")[0]  # is_player
-                                    )
+                    veh = empty_data
+                if veh == last_veh:  # skip unchanged row
+                    continue
+
+                # Update changed columns, or all columns if player state changed
+                is_player = veh[0]
+                player_changed = is_player != last_veh[0]
+                for update_column, row_bars, data_idx in self.column_update:
+                    curr = veh[data_idx]
+                    if player_changed or curr != last_veh[data_idx]:
+                        update_column(row_bars[idx], curr, is_player)
+
                 # Store last data reading
-                setattr(self, f"last_veh_{idx}", getattr(self, f"veh_{idx}"))
+                self.last_veh[idx] = veh
 
     # GUI update methods
-    def update_pos(self, suffix, curr, last, isplayer):
+    def update_pos(self, row_bar, curr, isplayer):
         """Driver position"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_position']};"
-                         f"background: {self.wcfg['bkg_color_player_position']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_position']};"
-                         f"background: {self.wcfg['bkg_color_position']};")
-
-            getattr(self, f"row_{suffix}").setText(curr[0])
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_pos}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
+        row_bar.setText(curr)
+        self.set_style(row_bar, self.style_pos[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-    def update_drv(self, suffix, curr, last, isplayer):
+    def update_drv(self, row_bar, curr, isplayer):
         """Driver name"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_driver_name']};"
-                         f"background: {self.wcfg['bkg_color_player_driver_name']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_driver_name']};"
-                         f"background: {self.wcfg['bkg_color_driver_name']};")
-
-            text = curr[0].upper() if self.wcfg["driver_name_uppercase"] else curr[0]
+        text = curr.upper() if self.driver_name_uppercase else curr
 
-            getattr(self, f"row_{suffix}").setText(
-                text[:self.drv_width].ljust(self.drv_width))
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_drv}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
+        row_bar.setText(
+            text[:self.drv_width].ljust(self.drv_width))
+        self.set_style(row_bar, self.style_drv[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-    def update_veh(self, suffix, curr, last, isplayer):
+    def update_veh(self, row_bar, curr, isplayer):
         """Vehicle name"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_vehicle_name']};"
-                         f"background: {self.wcfg['bkg_color_player_vehicle_name']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_vehicle_name']};"
-                         f"background: {self.wcfg['bkg_color_vehicle_name']};")
+        text = curr.upper() if self.vehicle_name_uppercase else curr
 
-            text = curr[0].upper() if self.wcfg["vehicle_name_uppercase"] else curr[0]
+        row_bar.setText(
+            text[:self.veh_width].ljust(self.veh_width))
+        self.set_style(row_bar, self.style_veh[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-            getattr(self, f"row_{suffix}").setText(
-                text[:self.veh_width].ljust(self.veh_width))
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_veh}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
-
-    def update_gap(self, suffix, curr, last, isplayer):
+    def update_gap(self, row_bar, curr, isplayer):
         """Time gap"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_time_gap']};"
-                         f"background: {self.wcfg['bkg_color_player_time_gap']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_time_gap']};"
-                         f"background: {self.wcfg['bkg_color_time_gap']};")
-
-            getattr(self, f"row_{suffix}").setText(
-                fmt.strip_decimal_pt(curr[0][:self.gap_width])
-            )
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_gap}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
+        row_bar.setText(
+            fmt.strip_decimal_pt(curr[:self.gap_width])
+        )
+        self.set_style(row_bar, self.style_gap[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-    def update_int(self, suffix, curr, last, isplayer):
+    def update_int(self, row_bar, curr, isplayer):
         """Time interval"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_time_interval']};"
-                         f"background: {self.wcfg['bkg_color_player_time_interval']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_time_interval']};"
-                         f"background: {self.wcfg['bkg_color_time_interval']};")
-
-            getattr(self, f"row_{suffix}").setText(
-                fmt.strip_decimal_pt(curr[0][:self.int_width])
-            )
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_int}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
+        row_bar.setText(
+            fmt.strip_decimal_pt(curr[:self.int_width])
+        )
+        self.set_style(row_bar, self.style_int[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-    def update_lpt(self, suffix, curr, last, isplayer):
+    def update_lpt(self, row_bar, curr, isplayer):
         """Vehicle laptime"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_laptime']};"
-                         f"background: {self.wcfg['bkg_color_player_laptime']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_laptime']};"
-                         f"background: {self.wcfg['bkg_color_laptime']};")
-
-            getattr(self, f"row_{suffix}").setText(curr[0])
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_lpt}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
+        row_bar.setText(curr)
+        self.set_style(row_bar, self.style_lpt[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-    def update_pic(self, suffix, curr, last, isplayer):
+    def update_pic(self, row_bar, curr, isplayer):
         """Position in class"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_position_in_class']};"
-                         f"background: {self.wcfg['bkg_color_player_position_in_class']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_position_in_class']};"
-                         f"background: {self.wcfg['bkg_color_position_in_class']};")
+        row_bar.setText(curr)
+        self.set_style(row_bar, self.style_pic[isplayer])
+        self.toggle_visibility(curr, row_bar)
 
-            getattr(self, f"row_{suffix}").setText(curr[0])
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_pic}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
-
-    def update_cls(self, suffix, curr, last):
+    def update_cls(self, row_bar, curr, isplayer):
         """Vehicle class"""
-        if curr != last:
-            text, bg_color = self.set_class_style(curr[0])
-            color = (f"color: {self.wcfg['font_color_class']};"
-                     f"background: {bg_color};")
-
-            getattr(self, f"row_{suffix}").setText(text[:self.cls_width])
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_cls}"
-            )
-            self.toggle_visibility(curr[0], getattr(self, f"row_{suffix}"))
+        text, style = self.set_class_style(curr)
+        row_bar.setText(text)
+        self.set_style(row_bar, style)
+        self.toggle_visibility(curr, row_bar)
 
-    def update_pit(self, suffix, curr, last):
+    def update_pit(self, row_bar, curr, isplayer):
         """Vehicle in pit"""
-        if curr != last:
-            text, bg_color = self.set_pitstatus(curr[0])
-            color = (f"color: {self.wcfg['font_color_pit']};"
-                     f"background: {bg_color};")
-
-            getattr(self, f"row_{suffix}").setText(text)
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_pit}"
-            )
-            self.toggle_visibility(text, getattr(self, f"row_{suffix}"))
+        text, style = self.set_pitstatus(curr)
+        row_bar.setText(text)
+        self.set_style(row_bar, style)
+        self.toggle_visibility(text, row_bar)
 
-    def update_tcp(self, suffix, curr, last, isplayer):
+    def update_tcp(self, row_bar, curr, isplayer):
         """Tyre compound index"""
-        if curr != last:
-            if self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_tyre_compound']};"
-                         f"background: {self.wcfg['bkg_color_player_tyre_compound']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_tyre_compound']};"
-                         f"background: {self.wcfg['bkg_color_tyre_compound']};")
-
-            text = self.set_tyre_cmp(curr[0])
-            getattr(self, f"row_{suffix}").setText(text)
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_tcp}"
-            )
-            self.toggle_visibility(text, getattr(self, f"row_{suffix}"))
+        text = self.set_tyre_cmp(curr)
+        row_bar.setText(text)
+        self.set_style(row_bar, self.style_tcp[isplayer])
+        self.toggle_visibility(text, row_bar)
 
-    def update_psc(self, suffix, curr, last, isplayer):
+    def update_psc(self, row_bar, curr, isplayer):
         """Pitstop count"""
-        if curr != last:
-            if self.wcfg["show_pit_request"] and curr[1] == 1:
-                color = (f"color: {self.wcfg['font_color_pit_request']};"
-                         f"background: {self.wcfg['bkg_color_pit_request']};")
-            elif self.wcfg["show_player_highlighted"] and isplayer:
-                color = (f"color: {self.wcfg['font_color_player_pitstop_count']};"
-                         f"background: {self.wcfg['bkg_color_player_pitstop_count']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_pitstop_count']};"
-                         f"background: {self.wcfg['bkg_color_pitstop_count']};")
+        if self.show_pit_request and curr[1] == 1:
+            style = self.style_psc_pit_request
+        else:
+            style = self.style_psc[isplayer]
 
-            text = self.set_pitcount(curr[0])
-            getattr(self, f"row_{suffix}").setText(text)
-            getattr(self, f"row_{suffix}").setStyleSheet(
-                f"{color}{self.bar_width_psc}"
-            )
-            self.toggle_visibility(text, getattr(self, f"row_{suffix}"))
+        text = self.set_pitcount(curr[0])
+        row_bar.setText(text)
+        self.set_style(row_bar, style)
+        self.toggle_visibility(text, row_bar)
 
     # Additional methods
+    def set_style(self, row_bar, style):
+        """Set row bar style, skip if same as last applied style"""
+        if self.last_style.get(row_bar) != style:
+            self.last_style[row_bar] = style
+            row_bar.setStyleSheet(style)
+
     def toggle_visibility(self, state, row_bar):
         """Hide row bar if empty data"""
-        if self.wcfg["split_gap"] > 0:
+        if self.split_gap > 0:
             if not state:  # add gap between non-empty data
-                row_bar.setStyleSheet(f"max-height:{self.wcfg['split_gap']}px;")
+                self.set_style(row_bar, self.style_split_gap)
         else:  # workaround to 1px minimum bar height limit
-            if state:
-                if row_bar.isHidden():
-                    row_bar.show()
-            else:
-                if not row_bar.isHidden():
-                    row_bar.hide()
+            visible = bool(state)
+            if self.last_visible.get(row_bar) != visible:
+                self.last_visible[row_bar] = visible
+                row_bar.setVisible(visible)
 
     def set_tyre_cmp(self, tc_index):
         """Substitute tyre compound index with custom chars"""
         if tc_index:
-            ftire, rtire = fmt.format_tyre_compound(
-                tc_index, self.cfg.units["tyre_compound_symbol"])
-            return f"{ftire}{rtire}"
+            text = self.tyre_cmp_cache.get(tc_index)
+            if text is None:
+                ftire, rtire = fmt.format_tyre_compound(
+                    tc_index, self.cfg.units["tyre_compound_symbol"])
+                text = self.tyre_cmp_cache[tc_index] = f"{ftire}{rtire}"
+            return text
         return ""
 
     def set_pitstatus(self, pits):
-        """Set pit status color"""
+        """Set pit status text & style"""
         if pits > 0:
-            return self.wcfg["pit_status_text"], self.wcfg["bkg_color_pit"]
-        return "", "#00000000"
+            return self.pit_status_text, self.style_pit[1]
+        return "", self.style_pit[0]
 
     @staticmethod
     def set_pitcount(pits):
@@ -554,13 +434,28 @@ class Draw(Widget):
         if pits == 0:
             return "-"
         if pits > 0:
-            return f"{pits}"
+            return str(pits)
         return ""
 
     def set_class_style(self, vehclass_name):
+        """Get vehicle class text & style from cache, or create new"""
+        class_style = self.class_style_cache.get(vehclass_name)
+        if class_style is None:
+            text, bg_color = self.create_class_style(vehclass_name)
+            class_style = (
+                text[:self.cls_width],
+                f"color: {self.wcfg['font_color_class']};"
+                f"background: {bg_color};"
+                f"{self.bar_width_cls}"
+            )
+            self.class_style_cache[vehclass_name] = class_style
+        return class_style
+
+    def create_class_style(self, vehclass_name):
         """Compare vehicle class name with user defined dictionary"""
-        if vehclass_name in self.cfg.classes_user:
-            return tuple(*self.cfg.classes_user[vehclass_name].items())  # sub_name, sub_color
+        class_user = self.cfg.classes_user.get(vehclass_name)
+        if class_user:
+            return tuple(*class_user.items())  # sub_name, sub_color
         if vehclass_name and self.wcfg["show_random_color_for_unknown_class"]:
             return vehclass_name, calc.random_color_class(vehclass_name)
         return vehclass_name, self.wcfg["bkg_color_class"]
@@ -569,115 +464,134 @@ class Draw(Widget):
     def set_laptime(inpit, laptime_last, pit_time):
         """Set lap time"""
         if inpit:
-            return "PIT" + f"{pit_time:.01f}"[:5].rjust(5) if pit_time > 0 else "-:--.---"
+            return f"PIT{pit_time:5.1f}" if pit_time > 0 else EMPTY_LAPTIME
         if laptime_last <= 0:
-            return "OUT" + f"{pit_time:.01f}"[:5].rjust(5) if pit_time > 0 else "-:--.---"
+            return f"OUT{pit_time:5.1f}" if pit_time > 0 else EMPTY_LAPTIME
         return calc.sec2laptime_full(laptime_last)[:8].rjust(8)
 
     def gap_to_leader_race(self, time_behind, laps_behind, position):
         """Gap to race leader"""
         if position == 1:
-            return self.wcfg["time_gap_leader_text"]
+            return self.gap_leader_text
         if time_behind == 0 and laps_behind > 0:
             return f"{laps_behind:.0f}L"
-        return f"{time_behind:.0{self.gap_decimals}f}"
+        return self.gap_format(time_behind)
 
     def gap_to_session_bestlap(self, bestlap, sbestlap, cbestlap):
         """Gap to session best laptime"""
-        if self.wcfg["show_time_gap_from_class_best"]:
+        if self.show_time_gap_from_class_best:
             time = bestlap - cbestlap  # class best
         else:
             time = bestlap - sbestlap  # session best
         if time == 0 and bestlap > 0:
-            return self.wcfg["time_gap_leader_text"]
+            return self.gap_leader_text
         if time < 0 or bestlap < 1:  # no time set
             return "0.0"
-        return f"{time:.0{self.gap_decimals}f}"
+        return self.gap_format(time)
 
     def int_to_next(self, time_behind, laps_behind, position):
         """Interval to next"""
         if position == 1:
-            return self.wcfg["time_interval_leader_text"]
+            return self.int_leader_text
         if time_behind == 0 and laps_behind > 0:
             return f"{laps_behind:.0f}L"
-        return f"{time_behind:.0{self.int_decimals}f}"
+        return self.int_format(time_behind)
 
-    def get_data(self, index, vehicles_data):
+    def get_data(self, index, vehicles_data, in_race):
         """Standings data"""
         # Prevent index out of range
         if vehicles_data and 0 <= index < len(vehicles_data):
+            veh_info = vehicles_data[index]
+
+            # Reuse last data if source values unchanged
+            fingerprint = (
+                in_race,
+                veh_info.isPlayer,
+                veh_info.position,
+                veh_info.driverName,
+                veh_info.vehicleName,
+                veh_info.positionInClass,
+                veh_info.vehicleClass,
+                veh_info.tireCompoundIndex,
+                veh_info.inPit,
+                veh_info.lastLapTime,
+                veh_info.pitTime,
+                veh_info.bestLapTime,
+                veh_info.sessionBestLapTime,
+                veh_info.classBestLapTime,
+                veh_info.timeBehindLeader,
+                veh_info.lapsBehindLeader,
+                veh_info.timeBehindNext,
+                veh_info.lapsBehindNext,
+                veh_info.numPitStops,
+                veh_info.pitState,
+            )
+            cache = self.veh_cache.get(index)
+            if cache and cache[0] == fingerprint:
+                return cache[1]
+
             # 0 Is player
-            is_player = vehicles_data[index].isPlayer
+            is_player = veh_info.isPlayer
 
             # 1 Vehicle in pit
-            in_pit = (vehicles_data[index].inPit, is_player)
+            in_pit = veh_info.inPit
 
             # 2 Driver position
-            position = (f"{vehicles_data[index].position:02d}", is_player)
+            position = f"{veh_info.position:02d}"
 
             # 3 Driver name
-            drv_name = (vehicles_data[index].driverName, is_player)
+            drv_name = veh_info.driverName
 
             # 4 Vehicle name
-            veh_name = (vehicles_data[index].vehicleName, is_player)
+            veh_name = veh_info.vehicleName
 
             # 5 Vehicle position in class
-            pos_class = (f"{vehicles_data[index].positionInClass:02d}", is_player)
+            pos_class = f"{veh_info.positionInClass:02d}"
 
             # 6 Vehicle class
-            veh_class = (vehicles_data[index].vehicleClass, is_player)
+            veh_class = veh_info.vehicleClass
 
             # 7 Tyre compound index
-            tire_idx = (vehicles_data[index].tireCompoundIndex, is_player)
+            tire_idx = veh_info.tireCompoundIndex
 
-            if api.read.session.in_race():
+            if in_race:
                 # 8 Lap time
-                laptime = (
-                    self.set_laptime(
-                        vehicles_data[index].inPit,
-                        vehicles_data[index].lastLapTime,
-                        vehicles_data[index].pitTime
-                    ),
-                    is_player)
+                laptime = self.set_laptime(
+                    veh_info.inPit,
+                    veh_info.lastLapTime,
+                    veh_info.pitTime
+                )
                 # 9 Time gap
-                time_gap = (
-                    self.gap_to_leader_race(
-                        vehicles_data[index].timeBehindLeader,
-                        vehicles_data[index].lapsBehindLeader,
-                        vehicles_data[index].position
-                    ),
-                    is_player)
+                time_gap = self.gap_to_leader_race(
+                    veh_info.timeBehindLeader,
+                    veh_info.lapsBehindLeader,
+                    veh_info.position
+                )
             else:
-                laptime = (
-                    self.set_laptime(
-                        0,
-                        vehicles_data[index].bestLapTime,
-                        0
-                    ),
-                    is_player)
-                time_gap = (
-                    self.gap_to_session_bestlap(
-                        vehicles_data[index].bestLapTime,
-                        vehicles_data[index].sessionBestLapTime,
-                        vehicles_data[index].classBestLapTime,
-                    ),
-                    is_player)
+                laptime = self.set_laptime(
+                    0,
+                    veh_info.bestLapTime,
+                    0
+                )
+                time_gap = self.gap_to_session_bestlap(
+                    veh_info.bestLapTime,
+                    veh_info.sessionBestLapTime,
+                    veh_info.classBestLapTime,
+                )
 
             # 10 Pitstop count
-            pit_count = (vehicles_data[index].numPitStops,
-                         vehicles_data[index].pitState,
-                         is_player)
+            pit_count = (veh_info.numPitStops, veh_info.pitState)
 
             # 11 Time interval
-            time_int = (
-                self.int_to_next(
-                    vehicles_data[index].timeBehindNext,
-                    vehicles_data[index].lapsBehindNext,
-                    vehicles_data[index].position
-                ),
-                is_player)
-
-            return (is_player, in_pit, position, drv_name, veh_name, pos_class, veh_class,
+            time_int = self.int_to_next(
+                veh_info.timeBehindNext,
+                veh_info.lapsBehindNext,
+                veh_info.position
+            )
+
+            data = (is_player, in_pit, position, drv_name, veh_name, pos_class, veh_class,
                     tire_idx, laptime, time_gap, pit_count, time_int)
+            self.veh_cache[index] = (fingerprint, data)
+            return data
         # Assign empty value to -1 index
         return self.empty_vehicles_data
@@ -20,8 +20,12 @@
 Track map Widget
 """
 
-from PySide2.QtCore import Qt, Slot, QRectF, QLineF
-from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QPen, QBrush, QColor
+import struct
+from math import ceil, cos, sin
+
+from PySide2.QtCore import Qt, Slot, QPointF, QRect, QRectF, QLineF, QByteArray, QDataStream
+from PySide2.QtGui import (
+    QPainterPath, QPainter, QPixmap, QPen, QBrush, QColor, QRegion, QFontMetricsF)
 
 from .. import calculation as calc
 from ..api_control import api
@@ -56,8 +60,33 @@ class Draw(Widget):
         self.temp_map_size = self.area_size - self.area_margin * 2
         self.resize(self.area_size, self.area_size)
 
-        self.pen = QPen()
-        self.brush = QBrush(Qt.SolidPattern)
+        # Vehicle pen & colors
+        if self.wcfg["vehicle_outline_width"]:
+            self.pen_veh_outline = QPen(QColor(self.wcfg["vehicle_outline_color"]))
+            self.pen_veh_outline.setWidth(self.wcfg["vehicle_outline_width"])
+        else:
+            self.pen_veh_outline = QPen(Qt.NoPen)
+        self.pen_veh_text = QPen(QColor(self.wcfg["font_color"]))
+
+        self.color_veh = (  # ordered by color_lapdiff index
+            QColor(self.wcfg["vehicle_color_player"]),
+            QColor(self.wcfg["vehicle_color_leader"]),
+            QColor(self.wcfg["vehicle_color_in_pit"]),
+            QColor(self.wcfg["vehicle_color_yellow"]),
+            QColor(self.wcfg["vehicle_color_laps_ahead"]),
+            QColor(self.wcfg["vehicle_color_laps_behind"]),
+            QColor(self.wcfg["vehicle_color_same_lap"]),
+        )
+
+        # Vehicle sprite cache, key: (color index, position), 0 position = no text
+        self.veh_sprite_cache = {}
+        margin_x, margin_top, margin_bottom = self.vehicle_sprite_margin()
+        self.veh_sprite_margin = margin_x, margin_top
+        self.veh_sprite_size = (
+            self.veh_size + margin_x * 2,
+            self.veh_size + margin_top + margin_bottom,
+        )
+
         self.draw_map_image(self.create_map_path(None))
 
         # Last data
@@ -66,7 +95,9 @@ class Draw(Widget):
         self.map_scale = 1
         self.map_offset = (0,0)
 
+        self.map_image_cache = {}
         self.vehicles_data = None
+        self.veh_pos = []
         self.last_coords_hash = -1
         self.last_veh_data_hash = None
         self.circular_map = True
@@ -80,27 +111,49 @@ class Draw(Widget):
         if self.wcfg["enable"] and api.state:
 
             # Map
-            coords_hash = minfo.mapping.coordinatesHash
-            self.update_map(coords_hash, self.last_coords_hash)
-            self.last_coords_hash = coords_hash
+            mapping = minfo.mapping
+            coords_hash = mapping.coordinatesHash
+            if coords_hash != self.last_coords_hash:
+                self.last_coords_hash = coords_hash
+                self.update_map(mapping, coords_hash)
 
             # Vehicles
-            veh_data_hash = minfo.vehicles.dataSetHash
-            self.update_veh(veh_data_hash, self.last_veh_data_hash)
-            self.last_veh_data_hash = veh_data_hash
+            vehicles = minfo.vehicles
+            veh_data_hash = vehicles.dataSetHash
+            if veh_data_hash != self.last_veh_data_hash:
+                self.last_veh_data_hash = veh_data_hash
+                self.update_veh(vehicles.dataSet)
 
     # GUI update methods
-    def update_map(self, curr, last):
+    def update_map(self, mapping, coords_hash):
         """Map update"""
-        if curr != last:
-            self.draw_map_image(
-                self.create_map_path(minfo.mapping.coordinates), self.circular_map)
-
-    def update_veh(self, curr, last):
-        """Vehicle update"""
-        if curr != last:
-            self.vehicles_data = minfo.vehicles.dataSet
-            self.update()
+        sectors_index = mapping.sectors
+        map_path = self.create_map_path(mapping.coordinates, sectors_index)
+        cache_key = (coords_hash, tuple(sectors_index) if sectors_index else None)
+        map_image = self.map_image_cache.get(cache_key)
+        if map_image is None:
+            self.draw_map_image(map_path, self.circular_map)
+            if len(self.map_image_cache) >= 5:  # drop oldest map image
+                self.map_image_cache.pop(next(iter(self.map_image_cache)))
+            self.map_image_cache[cache_key] = self.map_image
+        else:
+            self.map_image = map_image
+        if self.vehicles_data:  # rescale vehicle position to new map
+            self.veh_pos = self.vehicle_position(self.vehicles_data)
+        self.update()
+
+    def update_veh(self, vehicles_data):
+        """Vehicle update, repaint only area covered by old & new vehicle position"""
+        # Sort once per data update for drawing order
+        self.vehicles_data = sorted(vehicles_data or (), key=self.sort_vehicles)
+        veh_pos = self.vehicle_position(self.vehicles_data) if self.vehicles_data else []
+        dirty_region = QRegion()
+        for _, rect_sprite in self.veh_pos:
+            dirty_region += rect_sprite
+        for _, rect_sprite in veh_pos:
+            dirty_region += rect_sprite
+        self.veh_pos = veh_pos
+        self.update(dirty_region)
 
     def paintEvent(self, event):
         """Draw"""
@@ -108,25 +161,43 @@ class Draw(Widget):
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Draw map
-        painter.drawPixmap(0, 0, self.area_size, self.area_size, self.map_image)
+        painter.drawPixmap(0, 0, self.map_image)
 
         # Draw vehicles
         if self.vehicles_data:
-            self.draw_vehicle(painter)
+            self.draw_vehicle(painter, event.region())
 
-    def create_map_path(self, raw_coords):
-        """Create map path"""
+    def create_map_path(self, raw_coords, sectors_index=None):
+        """Create map path, start line & sector lines"""
         map_path = QPainterPath()
+        self.start_line = None
+        self.sector_lines = None
         if raw_coords:
             dist = calc.distance(raw_coords[0], raw_coords[-1])
             (self.map_scaled, self.map_range, self.map_scale, self.map_offset
              ) = calc.scale_map(raw_coords, self.area_size, self.area_margin)
 
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                else:
-                    map_path.lineTo(*coords)
+            self.stream_map_path(map_path, self.map_scaled)
+
+            # SF line
+            if self.wcfg["show_start_line"]:
+                self.start_line = QLineF(*calc.line_intersect_coords(
+                    self.map_scaled[0],  # point a
+                    self.map_scaled[1],  # point b
+                    1.57079633,  # 90 degree rotation
+                    self.wcfg["start_line_length"]
+                ))
+
+            # Sector lines
+            if self.wcfg["show_sector_line"] and sectors_index and all(sectors_index):
+                self.sector_lines = [
+                    QLineF(*calc.line_intersect_coords(
+                        self.map_scaled[sectors_index[idx]],  # point a
+                        self.map_scaled[sectors_index[idx] + 1],  # point b
+                        1.57079633,  # 90 degree rotation
+                        self.wcfg["sector_line_length"]
+                    )) for idx in range(2)
+                ]
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
@@ -157,11 +228,24 @@ class Draw(Widget):
                 )
             )
             self.circular_map = True
+
+            # SF line
+            if self.wcfg["show_start_line"]:
+                self.start_line = QLineF(
+                    self.area_margin - self.wcfg["start_line_length"],
+                    self.area_size / 2,
+                    self.area_margin + self.wcfg["start_line_length"],
+                    self.area_size / 2
+                )
         return map_path
 
     def draw_map_image(self, map_path, circular_map=True):
         """Draw map image separately"""
-        self.map_image = QPixmap(self.area_size, self.area_size)
+        # Match screen pixel ratio, so image is drawn without scaling
+        pixel_ratio = self.devicePixelRatioF()
+        image_size = round(self.area_size * pixel_ratio)
+        self.map_image = QPixmap(image_size, image_size)
+        self.map_image.setDevicePixelRatio(pixel_ratio)
         self.map_image.fill(Qt.transparent)
         painter = QPainter(self.map_image)
         painter.setRenderHint(QPainter.Antialiasing, True)
@@ -196,111 +280,150 @@ class Draw(Widget):
         painter.setPen(pen)
         painter.drawPath(map_path)
 
-        # Draw sector
-        if self.map_scaled:
-            # SF line
-            if self.wcfg["show_start_line"]:
-                pen.setWidth(self.wcfg["start_line_width"])
-                pen.setColor(QColor(self.wcfg["start_line_color"]))
-                painter.setPen(pen)
-                pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
-                    self.map_scaled[0],  # point a
-                    self.map_scaled[1],  # point b
-                    1.57079633,  # 90 degree rotation
-                    self.wcfg["start_line_length"]
-                )
-                painter.drawLine(QLineF(pos_x1, pos_y1, pos_x2, pos_y2))
+        # SF line
+        if self.start_line is not None:
+            pen.setWidth(self.wcfg["start_line_width"])
+            pen.setColor(QColor(self.wcfg["start_line_color"]))
+            painter.setPen(pen)
+            painter.drawLine(self.start_line)
 
-            # Sector lines
-            sectors_index = minfo.mapping.sectors
-            if self.wcfg["show_sector_line"] and sectors_index and all(sectors_index):
-                pen.setWidth(self.wcfg["sector_line_width"])
-                pen.setColor(QColor(self.wcfg["sector_line_color"]))
-                painter.setPen(pen)
+        # Sector lines
+        if self.sector_lines:
+            pen.setWidth(self.wcfg["sector_line_width"])
+            pen.setColor(QColor(self.wcfg["sector_line_color"]))
+            painter.setPen(pen)
+            painter.drawLines(self.sector_lines)
+
+    def draw_vehicle(self, painter, region):
+        """Draw vehicles within update region"""
+        show_standings = self.wcfg["show_vehicle_standings"]
+        for veh_info, (pos_sprite, rect_sprite) in zip(self.vehicles_data, self.veh_pos):
+            if not region.intersects(rect_sprite):
+                continue
+            color_index = self.color_lapdiff(
+                veh_info.isPlayer,
+                veh_info.position,
+                veh_info.inPit,
+                veh_info.isYellow,
+                veh_info.isLapped,
+                veh_info.inGarage,
+            )
+            painter.drawPixmap(
+                pos_sprite,
+                self.vehicle_sprite(color_index, veh_info.position if show_standings else 0)
+            )
 
-                for idx in range(2):
-                    pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
-                        self.map_scaled[sectors_index[idx]],  # point a
-                        self.map_scaled[sectors_index[idx] + 1],  # point b
-                        1.57079633,  # 90 degree rotation
-                        self.wcfg["sector_line_length"]
-                    )
-                    painter.drawLine(QLineF(pos_x1, pos_y1, pos_x2, pos_y2))
+    # Additional methods
+    def vehicle_position(self, vehicles):
+        """Vehicle sprite position & covered area on map"""
+        sprite_offset_x = self.veh_size / 2 + self.veh_sprite_margin[0]
+        sprite_offset_y = self.veh_size / 2 + self.veh_sprite_margin[1]
+        sprite_width = self.veh_sprite_size[0] + 1  # cover fractional position
+        sprite_height = self.veh_sprite_size[1] + 1
+
+        if self.last_coords_hash:
+            # Map scale & offset, same for all vehicles
+            min_range_x = self.map_range[0]
+            min_range_y = self.map_range[2]
+            map_scale = self.map_scale
+            map_offset_x, map_offset_y = self.map_offset
+            veh_pos = [
+                (round((veh_info.posXZ[0] - min_range_x) * map_scale + map_offset_x)
+                 - sprite_offset_x,
+                 round((veh_info.posXZ[1] - min_range_y) * map_scale + map_offset_y)
+                 - sprite_offset_y)
+                for veh_info in vehicles
+            ]
         else:
-            # SF line
-            if self.wcfg["show_start_line"]:
-                pen.setWidth(self.wcfg["start_line_width"])
-                pen.setColor(QColor(self.wcfg["start_line_color"]))
-                painter.setPen(pen)
-                painter.drawLine(
-                    QLineF(
-                        self.area_margin - self.wcfg["start_line_length"],
-                        self.area_size / 2,
-                        self.area_margin + self.wcfg["start_line_length"],
-                        self.area_size / 2
-                    )
-                )
-
-    def draw_vehicle(self, painter):
-        """Draw vehicles"""
-        if self.wcfg["show_vehicle_standings"]:
-            painter.setFont(self.font)
-
-        for veh_info in sorted(self.vehicles_data, key=self.sort_vehicles):
-            if self.last_coords_hash:
-                pos_x, pos_y = self.vehicle_scale(*veh_info.posXZ)
-                offset = 0
-            else:
-                inpit_offset = self.wcfg["font_size"] if veh_info.inPit else 0
-
-                pos_x, pos_y = calc.rotate_pos(
-                    6.2831853 * veh_info.percentageDistance,
-                    self.temp_map_size / -2 + inpit_offset,  # x pos
-                    0  # y pos
-                )
-                offset = self.area_size / 2
+            # Temp circular map, vehicle position rotated by lap distance
+            offset_x = self.area_size / 2 - sprite_offset_x
+            offset_y = self.area_size / 2 - sprite_offset_y
+            radius = self.temp_map_size / -2
+            radius_pit = radius + self.wcfg["font_size"]
+            veh_pos = []
+            for veh_info in vehicles:
+                pos_rad = 6.2831853 * veh_info.percentageDistance
+                pos_r = radius_pit if veh_info.inPit else radius
+                veh_pos.append((offset_x + cos(pos_rad) * pos_r,
+                                offset_y + sin(pos_rad) * pos_r))
+
+        return [
+            (QPointF(pos_x, pos_y),
+             QRect(int(pos_x), int(pos_y), sprite_width, sprite_height))
+            for pos_x, pos_y in veh_pos
+        ]
+
+    def vehicle_sprite_margin(self):
+        """Vehicle sprite margin around circle: horizontal, top, bottom
+
+        Covers circle outline, and standings text (up to 3 digits) that may
+        extend beyond circle with large font or offset, so text is not clipped.
+        """
+        margin = self.wcfg["vehicle_outline_width"] // 2 + 1
+        if not self.wcfg["show_vehicle_standings"]:
+            return margin, margin, margin
+
+        font_metrics = QFontMetricsF(self.font)
+        text_width = max(
+            font_metrics.boundingRect(str(digit) * 3).width() for digit in range(10))
+        text_height = font_metrics.height()
+        # Text is centered in circle rect below font offset, same as drawText in sprite
+        text_top = self.font_offset + (self.veh_size - self.font_offset - text_height) / 2
+        text_bottom = text_top + text_height
+        return (
+            max(margin, ceil((text_width - self.veh_size) / 2) + 1),
+            max(margin, ceil(-text_top) + 1),
+            max(margin, ceil(text_bottom - self.veh_size) + 1),
+        )
 
-            rect_vehicle = QRectF(
-                offset + pos_x - self.veh_size / 2,
-                offset + pos_y - self.veh_size / 2,
-                self.veh_size,
-                self.veh_size
-            )
+    def vehicle_sprite(self, color_index, position):
+        """Get pre-rendered vehicle circle & standings text from cache, or create new"""
+        sprite = self.veh_sprite_cache.get((color_index, position))
+        if sprite is None:
+            pixel_ratio = self.devicePixelRatioF()
+            sprite = QPixmap(
+                round(self.veh_sprite_size[0] * pixel_ratio),
+                round(self.veh_sprite_size[1] * pixel_ratio))
+            sprite.setDevicePixelRatio(pixel_ratio)
+            sprite.fill(Qt.transparent)
+            rect_vehicle = QRectF(*self.veh_sprite_margin, self.veh_size, self.veh_size)
+
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.Antialiasing, True)
 
             # Draw circle
-            if self.wcfg["vehicle_outline_width"]:
-                self.pen.setWidth(self.wcfg["vehicle_outline_width"])
-                self.pen.setColor(QColor(self.wcfg["vehicle_outline_color"]))
-                painter.setPen(self.pen)
-            else:
-                painter.setPen(Qt.NoPen)
-
-            self.brush.setColor(
-                QColor(
-                    self.color_lapdiff(
-                        veh_info.isPlayer,
-                        veh_info.position,
-                        veh_info.inPit,
-                        veh_info.isYellow,
-                        veh_info.isLapped,
-                        veh_info.inGarage,
-                    )
-                )
-            )
-            painter.setBrush(self.brush)
+            painter.setPen(self.pen_veh_outline)
+            painter.setBrush(self.color_veh[color_index])
             painter.drawEllipse(rect_vehicle)
 
             # Draw text standings
-            if self.wcfg["show_vehicle_standings"]:
-                self.pen.setColor(QColor(self.wcfg["font_color"]))
-                painter.setPen(self.pen)
+            if position:
+                painter.setPen(self.pen_veh_text)
+                painter.setFont(self.font)
                 painter.drawText(
                     rect_vehicle.adjusted(0, self.font_offset, 0, 0),
                     Qt.AlignCenter,
-                    f"{veh_info.position}"
+                    f"{position}"
                 )
+            self.veh_sprite_cache[(color_index, position)] = sprite
+        return sprite
+
+    @staticmethod
+    def stream_map_path(map_path, coords):
+        """Load coordinates into map path with a single data stream read
+
+        Packs coordinates in QPainterPath serialization format
+        (element count, [type, x, y] per element, subpath start, fill rule),
+        which avoids calling moveTo/lineTo for every point.
+        Element type: 0 = MoveTo, 1 = LineTo.
+        """
+        elements = [value for pos_x, pos_y in coords for value in (1, pos_x, pos_y)]
+        elements[0] = 0  # start with MoveTo
+        total = len(coords)
+        stream = QDataStream(
+            QByteArray(struct.pack(f">i{'idd' * total}ii", total, *elements, 0, 0)))
+        stream >> map_path
 
-    # Additional methods
     @staticmethod
     def sort_vehicles(veh_info):
         """Sort vehicle standings for drawing order"""
@@ -311,43 +434,18 @@ class Draw(Widget):
             -veh_info.position,  # reversed
         )
 
-    @staticmethod
-    def coords_scale(coords, min_range, scale, offset):
-        """Coordinates scale & offset"""
-        return (coords - min_range) * scale + offset
-
-    def vehicle_scale(self, raw_pos_x, raw_pos_y):
-        """Vehicle scale"""
-        veh_pos_x = round(
-            self.coords_scale(
-                raw_pos_x,
-                self.map_range[0],  # min range x
-                self.map_scale,
-                self.map_offset[0]  # offset x
-            )
-        )
-        veh_pos_y = round(
-            self.coords_scale(
-                raw_pos_y,
-                self.map_range[2],  # min range y
-                self.map_scale,
-                self.map_offset[1]  # offset y
-            )
-        )
-        return veh_pos_x, veh_pos_y
-
     def color_lapdiff(self, is_player, position, in_pit, is_yellow, is_lapped, in_garage):
-        """Compare lap differences & set color"""
+        """Compare lap differences & set color index"""
         if is_player:
-            return self.wcfg["vehicle_color_player"]
+            return 0
         if position == 1:
-            return self.wcfg["vehicle_color_leader"]
+            return 1
         if in_pit:
-            return self.wcfg["vehicle_color_in_pit"]
+            return 2
         if is_yellow and not in_pit + in_garage:
-            return self.wcfg["vehicle_color_yellow"]
+            return 3
         if is_lapped > 0:
-            return self.wcfg["vehicle_color_laps_ahead"]
+            return 4
         if is_lapped < 0:
-            return self.wcfg["vehicle_color_laps_behind"]
-        return self.wcfg["vehicle_color_same_lap"]
+            return 5
+        return 6
@@ -21,6 +21,7 @@ Tyre temperature Widget
 """
 
 from PySide2.QtCore import Qt, Slot
+from PySide2.QtGui import QColor, QPalette
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
@@ -53,8 +54,15 @@ class Draw(Widget):
 
         if self.cfg.units["temperature_unit"] == "Fahrenheit":
             text_width = 4 + len(self.sign_text)
+            self.temp_units = calc.celsius2fahrenheit
         else:
             text_width = 3 + len(self.sign_text)
+            self.temp_units = self.temp_celsius
+
+        if self.wcfg["show_inner_center_outer"]:
+            self.temp_mode = self.temp_inner_center_outer
+        else:
+            self.temp_mode = self.temp_average
 
         # Base style
         self.heatmap = hmp.load_heatmap(self.wcfg["heatmap_name"], "tyre_default")
@@ -104,94 +112,31 @@ class Draw(Widget):
                 layout_itemp.addWidget(bar_blank_2, 1, 4)
 
         # Tyre temperature
-        self.stemp_set = ("stemp_fl", "stemp_fr", "stemp_rl", "stemp_rr")
-        self.itemp_set = ("itemp_fl", "itemp_fr", "itemp_rl", "itemp_rr")
-
         self.bar_width_temp = font_m.width * text_width
-        bar_style_stemp = (
-            f"color: {self.wcfg['font_color_surface']};"
-            f"background: {self.wcfg['bkg_color_surface']};"
-            f"min-width: {self.bar_width_temp}px;"
-        )
-        bar_style_itemp = (
-            f"color: {self.wcfg['font_color_innerlayer']};"
-            f"background: {self.wcfg['bkg_color_innerlayer']};"
-            f"min-width: {self.bar_width_temp}px;"
-        )
-
+        bar_style_temp = f"min-width: {self.bar_width_temp}px;"
+
+        # Heatmap palette, cached per rounded temperature
+        self.palette_cache = {}
+        self.stemp_palette = {}
+        self.itemp_palette = {}
+        self.color_stemp = (
+            self.wcfg["font_color_surface"], self.wcfg["bkg_color_surface"])
+        self.color_itemp = (
+            self.wcfg["font_color_innerlayer"], self.wcfg["bkg_color_innerlayer"])
+
+        # Column index of each temperature reading, per wheel: fl, fr, rl, rr
         if self.wcfg["show_inner_center_outer"]:
-            for suffix in self.stemp_set:
-                for idx in range(3):
-                    setattr(self, f"bar_{suffix}_{idx}", QLabel(text_def))
-                    getattr(self, f"bar_{suffix}_{idx}").setAlignment(Qt.AlignCenter)
-                    getattr(self, f"bar_{suffix}_{idx}").setStyleSheet(bar_style_stemp)
-                    if suffix == "stemp_fl":  # 2 1 0
-                        layout_stemp.addWidget(
-                            getattr(self, f"bar_{suffix}_{idx}"), 0, 2 - idx)
-                    if suffix == "stemp_fr":  # 7 8 9
-                        layout_stemp.addWidget(
-                            getattr(self, f"bar_{suffix}_{idx}"), 0, 7 + idx)
-                    if suffix == "stemp_rl":  # 2 1 0
-                        layout_stemp.addWidget(
-                            getattr(self, f"bar_{suffix}_{idx}"), 1, 2 - idx)
-                    if suffix == "stemp_rr":  # 7 8 9
-                        layout_stemp.addWidget(
-                            getattr(self, f"bar_{suffix}_{idx}"), 1, 7 + idx)
-
-            if self.wcfg["show_innerlayer"]:
-                for suffix in self.itemp_set:
-                    for idx in range(3):
-                        setattr(self, f"bar_{suffix}_{idx}", QLabel(text_def))
-                        getattr(self, f"bar_{suffix}_{idx}").setAlignment(Qt.AlignCenter)
-                        getattr(self, f"bar_{suffix}_{idx}").setStyleSheet(bar_style_itemp)
-                        if suffix == "itemp_fl":  # 2 1 0
-                            layout_itemp.addWidget(
-                                getattr(self, f"bar_{suffix}_{idx}"), 0, 2 - idx)
-                        if suffix == "itemp_fr":  # 7 8 9
-                            layout_itemp.addWidget(
-                                getattr(self, f"bar_{suffix}_{idx}"), 0, 7 + idx)
-                        if suffix == "itemp_rl":  # 2 1 0
-                            layout_itemp.addWidget(
-                                getattr(self, f"bar_{suffix}_{idx}"), 1, 2 - idx)
-                        if suffix == "itemp_rr":  # 7 8 9
-                            layout_itemp.addWidget(
-                                getattr(self, f"bar_{suffix}_{idx}"), 1, 7 + idx)
-
+            temp_column = ((0, 1, 2), (7, 8, 9), (0, 1, 2), (7, 8, 9))
         else:
-            for suffix in self.stemp_set:
-                setattr(self, f"bar_{suffix}", QLabel(text_def))
-                getattr(self, f"bar_{suffix}").setAlignment(Qt.AlignCenter)
-                getattr(self, f"bar_{suffix}").setStyleSheet(bar_style_stemp)
-                if suffix == "stemp_fl":  # 0
-                    layout_stemp.addWidget(
-                        getattr(self, f"bar_{suffix}"), 0, 0)
-                if suffix == "stemp_fr":  # 9
-                    layout_stemp.addWidget(
-                        getattr(self, f"bar_{suffix}"), 0, 9)
-                if suffix == "stemp_rl":  # 0
-                    layout_stemp.addWidget(
-                        getattr(self, f"bar_{suffix}"), 1, 0)
-                if suffix == "stemp_rr":  # 9
-                    layout_stemp.addWidget(
-                        getattr(self, f"bar_{suffix}"), 1, 9)
+            temp_column = ((0,), (9,), (0,), (9,))
 
-            if self.wcfg["show_innerlayer"]:
-                for suffix in self.itemp_set:
-                    setattr(self, f"bar_{suffix}", QLabel(text_def))
-                    getattr(self, f"bar_{suffix}").setAlignment(Qt.AlignCenter)
-                    getattr(self, f"bar_{suffix}").setStyleSheet(bar_style_itemp)
-                    if suffix == "itemp_fl":  # 0
-                        layout_itemp.addWidget(
-                            getattr(self, f"bar_{suffix}"), 0, 0)
-                    if suffix == "itemp_fr":  # 9
-                        layout_itemp.addWidget(
-                            getattr(self, f"bar_{suffix}"), 0, 9)
-                    if suffix == "itemp_rl":  # 0
-                        layout_itemp.addWidget(
-                            getattr(self, f"bar_{suffix}"), 1, 0)
-                    if suffix == "itemp_rr":  # 9
-                        layout_itemp.addWidget(
-                            getattr(self, f"bar_{suffix}"), 1, 9)
+        self.bars_stemp = self.generate_bar(
+            layout_stemp, bar_style_temp, self.set_palette(*self.color_stemp),
+            temp_column, text_def)
+        if self.wcfg["show_innerlayer"]:
+            self.bars_itemp = self.generate_bar(
+                layout_itemp, bar_style_temp, self.set_palette(*self.color_itemp),
+                temp_column, text_def)
 
         # Set layout
         if self.wcfg["layout"] == 0:
@@ -208,12 +153,9 @@ class Draw(Widget):
 
         # Last data
         self.last_tcmpd = [None] * 2
-        if self.wcfg["show_inner_center_outer"]:
-            self.last_stemp = [[-273.15] * 3 for _ in range(4)]
-            self.last_itemp = [[-273.15] * 3 for _ in range(4)]
-        else:
-            self.last_stemp = [-273.15] * 4
-            self.last_itemp = [-273.15] * 4
+        # Temperature is compared after rounding, grouped per wheel
+        self.last_stemp = tuple((-273,) * len(column) for column in temp_column)
+        self.last_itemp = self.last_stemp
 
         # Set widget state & start update
         self.set_widget_state()
@@ -221,7 +163,7 @@ class Draw(Widget):
     @Slot()
     def update_data(self):
         """Update when vehicle on track"""
-        if self.wcfg["enable"] and api.state:
+        if self.wcfg["enable"] and api.state and self.isVisible():
 
             # Tyre compound
             if self.wcfg["show_tyre_compound"]:
@@ -230,117 +172,52 @@ class Draw(Widget):
                 self.update_tcmpd(tcmpd, self.last_tcmpd)
                 self.last_tcmpd = tcmpd
 
-            # Tyre temperature
+            # Surface temperature
             stemp = tuple(map(self.temp_mode, api.read.tyre.surface_temperature()))
+            self.last_stemp = self.update_temp_set(
+                self.bars_stemp, stemp, self.last_stemp, self.update_stemp)
 
-            # Inner, center, outer mode
-            if self.wcfg["show_inner_center_outer"]:
-                # Surface temperature
-                for suffix in self.stemp_set:
-                    for idx in range(3):
-                        if suffix == "stemp_fl":  # 2 1 0
-                            self.update_stemp(
-                                f"{suffix}_{idx}",
-                                stemp[0][2 - idx],
-                                self.last_stemp[0][2 - idx]
-                            )
-                        if suffix == "stemp_fr":  # 0 1 2
-                            self.update_stemp(
-                                f"{suffix}_{idx}",
-                                stemp[1][idx],
-                                self.last_stemp[1][idx]
-                            )
-                        if suffix == "stemp_rl":  # 2 1 0
-                            self.update_stemp(
-                                f"{suffix}_{idx}",
-                                stemp[2][2 - idx],
-                                self.last_stemp[2][2 - idx]
-                            )
-                        if suffix == "stemp_rr":  # 0 1 2
-                            self.update_stemp(
-                                f"{suffix}_{idx}",
-                                stemp[3][idx],
-                                self.last_stemp[3][idx]
-                            )
-                self.last_stemp = stemp
-
-                # Inner layer temperature
-                if self.wcfg["show_innerlayer"]:
-                    itemp = tuple(map(
-                        self.temp_mode, api.read.tyre.inner_temperature()))
-                    for suffix in self.itemp_set:
-                        for idx in range(3):
-                            if suffix == "itemp_fl":  # 2 1 0
-                                self.update_itemp(
-                                    f"{suffix}_{idx}",
-                                    itemp[0][2 - idx],
-                                    self.last_itemp[0][2 - idx]
-                                )
-                            if suffix == "itemp_fr":  # 0 1 2
-                                self.update_itemp(
-                                    f"{suffix}_{idx}",
-                                    itemp[1][idx],
-                                    self.last_itemp[1][idx]
-                                )
-                            if suffix == "itemp_rl":  # 2 1 0
-                                self.update_itemp(
-                                    f"{suffix}_{idx}",
-                                    itemp[2][2 - idx],
-                                    self.last_itemp[2][2 - idx]
-                                )
-                            if suffix == "itemp_rr":  # 0 1 2
-                                self.update_itemp(
-                                    f"{suffix}_{idx}",
-                                    itemp[3][idx],
-                                    self.last_itemp[3][idx]
-                                )
-                    self.last_itemp = itemp
-            # Average mode
-            else:
-                # Surface temperature
-                for idx, suffix in enumerate(self.stemp_set):
-                    self.update_stemp(suffix, stemp[idx], self.last_stemp[idx])
-                self.last_stemp = stemp
-                # Inner layer temperature
-                if self.wcfg["show_innerlayer"]:
-                    itemp = tuple(map(
-                        self.temp_mode, api.read.tyre.inner_temperature()))
-                    for idx, suffix in enumerate(self.itemp_set):
-                        self.update_itemp(suffix, itemp[idx], self.last_itemp[idx])
-                    self.last_itemp = itemp
+            # Inner layer temperature
+            if self.wcfg["show_innerlayer"]:
+                itemp = tuple(map(self.temp_mode, api.read.tyre.inner_temperature()))
+                self.last_itemp = self.update_temp_set(
+                    self.bars_itemp, itemp, self.last_itemp, self.update_itemp)
 
     # GUI update methods
-    def update_stemp(self, suffix, curr, last):
+    def update_stemp(self, bar_temp, curr, curr_rounded, last_rounded):
         """Tyre surface temperature"""
-        if round(curr) != round(last):
-            if self.wcfg["swap_style"]:
-                color = (f"color: {self.wcfg['font_color_surface']};"
-                         f"background: {hmp.select_color(self.heatmap, curr)};")
-            else:
-                color = (f"color: {hmp.select_color(self.heatmap, curr)};"
-                         f"background: {self.wcfg['bkg_color_surface']};")
-
-            getattr(self, f"bar_{suffix}").setText(
-                f"{self.temp_units(curr):0{self.leading_zero}.0f}{self.sign_text}")
-
-            getattr(self, f"bar_{suffix}").setStyleSheet(
-                f"{color}min-width: {self.bar_width_temp}px;")
-
-    def update_itemp(self, suffix, curr, last):
+        bar_temp.setText(
+            f"{self.temp_units(curr):0{self.leading_zero}.0f}{self.sign_text}")
+        palette = self.heat_palette(
+            self.stemp_palette, self.color_stemp, curr_rounded)
+        if palette is not self.stemp_palette.get(last_rounded):
+            bar_temp.setPalette(palette)
+
+    def update_itemp(self, bar_temp, curr, curr_rounded, last_rounded):
         """Tyre inner temperature"""
-        if round(curr) != round(last):
-            if self.wcfg["swap_style"]:
-                color = (f"color: {self.wcfg['font_color_innerlayer']};"
-                         f"background: {hmp.select_color(self.heatmap, curr)};")
-            else:
-                color = (f"color: {hmp.select_color(self.heatmap, curr)};"
-                         f"background: {self.wcfg['bkg_color_innerlayer']};")
-
-            getattr(self, f"bar_{suffix}").setText(
-                f"{self.temp_units(curr):0{self.leading_zero}.0f}{self.sign_text}")
-
-            getattr(self, f"bar_{suffix}").setStyleSheet(
-                f"{color}min-width: {self.bar_width_temp}px;")
+        bar_temp.setText(
+            f"{self.temp_units(curr):0{self.leading_zero}.0f}{self.sign_text}")
+        palette = self.heat_palette(
+            self.itemp_palette, self.color_itemp, curr_rounded)
+        if palette is not self.itemp_palette.get(last_rounded):
+            bar_temp.setPalette(palette)
+
+    @staticmethod
+    def update_temp_set(bars_set, curr_set, last_set, update_temp):
+        """Update temperature set, only bars with changed rounded reading
+
+        Return rounded temperature set for next comparison.
+        """
+        rounded_set = tuple(tuple(map(round, curr)) for curr in curr_set)
+        if rounded_set != last_set:
+            for bars, curr, rounded, last in zip(
+                    bars_set, curr_set, rounded_set, last_set):
+                if rounded != last:
+                    for bar_temp, curr_temp, curr_rounded, last_rounded in zip(
+                            bars, curr, rounded, last):
+                        if curr_rounded != last_rounded:
+                            update_temp(bar_temp, curr_temp, curr_rounded, last_rounded)
+        return rounded_set
 
     def update_tcmpd(self, curr, last):
         """Tyre compound"""
@@ -349,14 +226,56 @@ class Draw(Widget):
             self.bar_tcmpd_r.setText(curr[1])
 
     # Additional methods
-    def temp_mode(self, value):
+    @staticmethod
+    def generate_bar(layout, bar_style, palette, temp_column, text):
+        """Generate temperature bars, grouped per wheel"""
+        bars = []
+        for wheel_idx, columns in enumerate(temp_column):
+            wheel_bars = []
+            for column_idx in columns:
+                bar_temp = QLabel(text)
+                bar_temp.setAlignment(Qt.AlignCenter)
+                bar_temp.setStyleSheet(bar_style)
+                bar_temp.setAutoFillBackground(True)
+                bar_temp.setPalette(palette)
+                layout.addWidget(bar_temp, wheel_idx // 2, column_idx)
+                wheel_bars.append(bar_temp)
+            bars.append(tuple(wheel_bars))
+        return tuple(bars)
+
+    def heat_palette(self, temp_palette, color, temp):
+        """Heatmap palette of rounded temperature"""
+        palette = temp_palette.get(temp)
+        if palette is None:
+            heat_color = hmp.select_color(self.heatmap, temp)
+            if self.wcfg["swap_style"]:
+                palette = self.set_palette(color[0], heat_color)
+            else:
+                palette = self.set_palette(heat_color, color[1])
+            temp_palette[temp] = palette
+        return palette
+
+    def set_palette(self, font_color, bkg_color):
+        """Palette of font & background color, shared between bars"""
+        palette = self.palette_cache.get((font_color, bkg_color))
+        if palette is None:
+            palette = QPalette()
+            palette.setColor(QPalette.WindowText, QColor(font_color))
+            palette.setColor(QPalette.Window, QColor(bkg_color))
+            self.palette_cache[font_color, bkg_color] = palette
+        return palette
+
+    @staticmethod
+    def temp_inner_center_outer(value):
         """Temperature inner/center/outer mode"""
-        if self.wcfg["show_inner_center_outer"]:
-            return value
-        return sum(value) / 3
-
-    def temp_units(self, value):
-        """Temperature units"""
-        if self.cfg.units["temperature_unit"] == "Fahrenheit":
-            return calc.celsius2fahrenheit(value)
         return value
+
+    @staticmethod
+    def temp_average(value):
+        """Temperature average mode"""
+        return ((value[0] + value[1] + value[2]) / 3,)
+
+    @staticmethod
+    def temp_celsius(temp):
+        """Temperature in Celsius"""
+        return temp
@@ -45,6 +45,15 @@ class Draw(Widget):
         bar_padx = round(self.wcfg["font_size"] * self.wcfg["bar_padding"])
         bar_gap = self.wcfg["bar_gap"]
         self.bar_width = font_m.width * 4
+        self.show_remaining = self.wcfg["show_remaining"]
+        self.show_wear_difference = self.wcfg["show_wear_difference"]
+        self.show_live_wear_difference = (
+            self.show_wear_difference and self.wcfg["show_live_wear_difference"])
+        self.show_lifespan = self.wcfg["show_lifespan"]
+        self.freeze_duration = self.wcfg["freeze_duration"]
+        self.threshold_remaining = self.wcfg["warning_threshold_remaining"]
+        self.threshold_wear = self.wcfg["warning_threshold_wear"]
+        self.threshold_laps = self.wcfg["warning_threshold_laps"]
 
         # Base style
         self.setStyleSheet(
@@ -57,12 +66,6 @@ class Draw(Widget):
         # Create layout
         layout = QGridLayout()
         layout.setContentsMargins(0,0,0,0)  # remove border
-        layout_twear = QGridLayout()
-        layout_tdiff = QGridLayout()
-        layout_tlaps = QGridLayout()
-        layout_twear.setSpacing(0)
-        layout_tdiff.setSpacing(0)
-        layout_tlaps.setSpacing(0)
         layout.setSpacing(bar_gap)
         layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
 
@@ -77,95 +80,26 @@ class Draw(Widget):
                 f"background: {self.wcfg['bkg_color_caption']};"
                 f"font-size: {int(self.wcfg['font_size'] * 0.8)}px;"
             )
-            bar_desc_twear = QLabel("tyre wear")
-            bar_desc_twear.setAlignment(Qt.AlignCenter)
-            bar_desc_twear.setStyleSheet(bar_style_desc)
-            layout_twear.addWidget(bar_desc_twear, 0, 0, 1, 0)
-
-            bar_desc_tdiff = QLabel("wear diff")
-            bar_desc_tdiff.setAlignment(Qt.AlignCenter)
-            bar_desc_tdiff.setStyleSheet(bar_style_desc)
-            layout_tdiff.addWidget(bar_desc_tdiff, 0, 0, 1, 0)
-
-            bar_desc_tlaps = QLabel("est. laps")
-            bar_desc_tlaps.setAlignment(Qt.AlignCenter)
-            bar_desc_tlaps.setStyleSheet(bar_style_desc)
-            layout_tlaps.addWidget(bar_desc_tlaps, 0, 0, 1, 0)
+        else:
+            bar_style_desc = None
 
         # Remaining tyre wear
         if self.wcfg["show_remaining"]:
-            bar_style_twear = (
-                f"color: {self.wcfg['font_color_remaining']};"
-                f"background: {self.wcfg['bkg_color_remaining']};"
-                f"min-width: {self.bar_width}px;"
-            )
-            self.bar_twear_fl = QLabel(text_def)
-            self.bar_twear_fl.setAlignment(Qt.AlignCenter)
-            self.bar_twear_fl.setStyleSheet(bar_style_twear)
-            self.bar_twear_fr = QLabel(text_def)
-            self.bar_twear_fr.setAlignment(Qt.AlignCenter)
-            self.bar_twear_fr.setStyleSheet(bar_style_twear)
-            self.bar_twear_rl = QLabel(text_def)
-            self.bar_twear_rl.setAlignment(Qt.AlignCenter)
-            self.bar_twear_rl.setStyleSheet(bar_style_twear)
-            self.bar_twear_rr = QLabel(text_def)
-            self.bar_twear_rr.setAlignment(Qt.AlignCenter)
-            self.bar_twear_rr.setStyleSheet(bar_style_twear)
-
-            layout_twear.addWidget(self.bar_twear_fl, 1, 0)
-            layout_twear.addWidget(self.bar_twear_fr, 1, 1)
-            layout_twear.addWidget(self.bar_twear_rl, 2, 0)
-            layout_twear.addWidget(self.bar_twear_rr, 2, 1)
+            self.style_twear = self.bar_style("remaining")
+            layout_twear, self.bars_twear = self.generate_group(
+                "tyre wear", bar_style_desc, self.style_twear[0], text_def)
 
         # Tyre wear difference
         if self.wcfg["show_wear_difference"]:
-            bar_style_tdiff = (
-                f"color: {self.wcfg['font_color_wear_difference']};"
-                f"background: {self.wcfg['bkg_color_wear_difference']};"
-                f"min-width: {self.bar_width}px;"
-            )
-            self.bar_tdiff_fl = QLabel(text_def)
-            self.bar_tdiff_fl.setAlignment(Qt.AlignCenter)
-            self.bar_tdiff_fl.setStyleSheet(bar_style_tdiff)
-            self.bar_tdiff_fr = QLabel(text_def)
-            self.bar_tdiff_fr.setAlignment(Qt.AlignCenter)
-            self.bar_tdiff_fr.setStyleSheet(bar_style_tdiff)
-            self.bar_tdiff_rl = QLabel(text_def)
-            self.bar_tdiff_rl.setAlignment(Qt.AlignCenter)
-            self.bar_tdiff_rl.setStyleSheet(bar_style_tdiff)
-            self.bar_tdiff_rr = QLabel(text_def)
-            self.bar_tdiff_rr.setAlignment(Qt.AlignCenter)
-            self.bar_tdiff_rr.setStyleSheet(bar_style_tdiff)
-
-            layout_tdiff.addWidget(self.bar_tdiff_fl, 1, 0)
-            layout_tdiff.addWidget(self.bar_tdiff_fr, 1, 1)
-            layout_tdiff.addWidget(self.bar_tdiff_rl, 2, 0)
-            layout_tdiff.addWidget(self.bar_tdiff_rr, 2, 1)
+            self.style_tdiff = self.bar_style("wear_difference")
+            layout_tdiff, self.bars_tdiff = self.generate_group(
+                "wear diff", bar_style_desc, self.style_tdiff[0], text_def)
 
         # Estimated tyre lifespan in laps
         if self.wcfg["show_lifespan"]:
-            bar_style_tlaps = (
-                f"color: {self.wcfg['font_color_lifespan']};"
-                f"background: {self.wcfg['bkg_color_lifespan']};"
-                f"min-width: {self.bar_width}px;"
-            )
-            self.bar_tlaps_fl = QLabel(text_def)
-            self.bar_tlaps_fl.setAlignment(Qt.AlignCenter)
-            self.bar_tlaps_fl.setStyleSheet(bar_style_tlaps)
-            self.bar_tlaps_fr = QLabel(text_def)
-            self.bar_tlaps_fr.setAlignment(Qt.AlignCenter)
-            self.bar_tlaps_fr.setStyleSheet(bar_style_tlaps)
-            self.bar_tlaps_rl = QLabel(text_def)
-            self.bar_tlaps_rl.setAlignment(Qt.AlignCenter)
-            self.bar_tlaps_rl.setStyleSheet(bar_style_tlaps)
-            self.bar_tlaps_rr = QLabel(text_def)
-            self.bar_tlaps_rr.setAlignment(Qt.AlignCenter)
-            self.bar_tlaps_rr.setStyleSheet(bar_style_tlaps)
-
-            layout_tlaps.addWidget(self.bar_tlaps_fl, 1, 0)
-            layout_tlaps.addWidget(self.bar_tlaps_fr, 1, 1)
-            layout_tlaps.addWidget(self.bar_tlaps_rl, 2, 0)
-            layout_tlaps.addWidget(self.bar_tlaps_rr, 2, 1)
+            self.style_tlaps = self.bar_style("lifespan")
+            layout_tlaps, self.bars_tlaps = self.generate_group(
+                "est. laps", bar_style_desc, self.style_tlaps[0], text_def)
 
         # Set layout
         if self.wcfg["layout"] == 0:
@@ -189,15 +123,24 @@ class Draw(Widget):
         # Last data
         self.checked = False
         self.last_lap_stime = 0  # last lap start time
-        self.wear_last = [0,0,0,0]  # last recorded remaining tyre wear
-        self.wear_live = [0,0,0,0]  # live tyre wear update of current lap
-        self.wear_per = [0,0,0,0]  # total tyre wear of last lap
-        self.wear_laps = [0,0,0,0]  # estimated tyre lifespan in laps
-
-        self.last_wear_curr = [None] * 4
-        self.last_wear_live = [None] * 4
-        self.last_wear_per = [None] * 4
-        self.last_wear_laps = [None] * 4
+        self.wear_last = (0,0,0,0)  # last recorded remaining tyre wear
+        self.wear_live = (0,0,0,0)  # live tyre wear update of current lap
+        self.wear_per = (0,0,0,0)  # total tyre wear of last lap
+        self.wear_laps = (0,0,0,0)  # estimated tyre lifespan in laps
+
+        self.last_wear_curr = (None,) * 4
+        self.last_wear_live = (None,) * 4
+        self.last_wear_per = (None,) * 4
+        self.last_wear_laps = (None,) * 4
+        self.last_wear_state = None
+
+        # Last text & warning state per bar, skip unchanged text or style
+        self.text_twear = [None] * 4
+        self.text_tdiff = [None] * 4
+        self.text_tlaps = [None] * 4
+        self.warning_twear = [None] * 4
+        self.warning_tdiff = [None] * 4
+        self.warning_tlaps = [None] * 4
 
         # Set widget state & start update
         self.set_widget_state()
@@ -211,129 +154,153 @@ class Draw(Widget):
             if not self.checked:
                 self.checked = True
 
-            # Read tyre wear data
-            lap_stime = api.read.timing.start()
-            lap_etime = api.read.timing.elapsed()
-            wear_curr = tuple(map(self.round2decimal, api.read.tyre.wear()))
-
-            # Update tyre wear differences
-            self.wear_last, self.wear_live = zip(
-                *tuple(map(self.wear_diff, wear_curr, self.wear_last, self.wear_live)))
+            # Read tyre wear data, resolve API reader once per update
+            read = api.read
+            timing = read.timing
+            lap_stime = timing.start()
+            raw_wear = read.tyre.wear()
+            # Elapsed time is only read if live wear difference is shown
+            live_diff = (self.show_live_wear_difference and
+                         timing.elapsed() - lap_stime > self.freeze_duration)
+
+            # Skip if no new wear reading, and lap & wear diff mode unchanged
+            wear_state = (lap_stime, live_diff, raw_wear)
+            if wear_state == self.last_wear_state:
+                return
+            self.last_wear_state = wear_state
+
+            wear_curr = tuple([round(value * 100, 2) for value in raw_wear])
+
+            # Update tyre wear differences, accumulate wear only when remaining decreased
+            self.wear_live = tuple([
+                wear_live + (wear_last - value) if wear_last > value else wear_live
+                for value, wear_last, wear_live in zip(wear_curr, self.wear_last, self.wear_live)
+            ])
+            self.wear_last = wear_curr
 
             if lap_stime != self.last_lap_stime:  # time stamp difference
                 self.wear_per = self.wear_live
-                self.wear_live = [0,0,0,0]  # reset real time wear
+                self.wear_live = (0,0,0,0)  # reset real time wear
                 self.last_lap_stime = lap_stime  # reset time stamp counter
 
             # Remaining tyre wear
-            if self.wcfg["show_remaining"]:
-                self.update_wear("fl", wear_curr[0], self.last_wear_curr[0],
-                                 self.wcfg["warning_threshold_remaining"])
-                self.update_wear("fr", wear_curr[1], self.last_wear_curr[1],
-                                 self.wcfg["warning_threshold_remaining"])
-                self.update_wear("rl", wear_curr[2], self.last_wear_curr[2],
-                                 self.wcfg["warning_threshold_remaining"])
-                self.update_wear("rr", wear_curr[3], self.last_wear_curr[3],
-                                 self.wcfg["warning_threshold_remaining"])
+            if self.show_remaining and wear_curr != self.last_wear_curr:
+                self.update_wear(0, wear_curr[0], self.last_wear_curr[0])
+                self.update_wear(1, wear_curr[1], self.last_wear_curr[1])
+                self.update_wear(2, wear_curr[2], self.last_wear_curr[2])
+                self.update_wear(3, wear_curr[3], self.last_wear_curr[3])
                 self.last_wear_curr = wear_curr
 
             # Tyre wear differences
-            if self.wcfg["show_wear_difference"]:
+            if self.show_wear_difference:
                 # Realtime diff
-                if (self.wcfg["show_live_wear_difference"] and
-                    lap_etime - lap_stime > self.wcfg["freeze_duration"]):
-                    self.update_diff("fl", self.wear_live[0], self.last_wear_live[0],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.update_diff("fr", self.wear_live[1], self.last_wear_live[1],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.update_diff("rl", self.wear_live[2], self.last_wear_live[2],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.update_diff("rr", self.wear_live[3], self.last_wear_live[3],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.last_wear_live = self.wear_live
-                else:
+                if live_diff:
+                    if self.wear_live != self.last_wear_live:
+                        self.update_diff(0, self.wear_live[0], self.last_wear_live[0])
+                        self.update_diff(1, self.wear_live[1], self.last_wear_live[1])
+                        self.update_diff(2, self.wear_live[2], self.last_wear_live[2])
+                        self.update_diff(3, self.wear_live[3], self.last_wear_live[3])
+                        self.last_wear_live = self.wear_live
+                elif self.wear_per != self.last_wear_per:
                     # Last lap diff
-                    self.update_diff("fl", self.wear_per[0], self.last_wear_per[0],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.update_diff("fr", self.wear_per[1], self.last_wear_per[1],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.update_diff("rl", self.wear_per[2], self.last_wear_per[2],
-                                     self.wcfg["warning_threshold_wear"])
-                    self.update_diff("rr", self.wear_per[3], self.last_wear_per[3],
-                                     self.wcfg["warning_threshold_wear"])
+                    self.update_diff(0, self.wear_per[0], self.last_wear_per[0])
+                    self.update_diff(1, self.wear_per[1], self.last_wear_per[1])
+                    self.update_diff(2, self.wear_per[2], self.last_wear_per[2])
+                    self.update_diff(3, self.wear_per[3], self.last_wear_per[3])
                     self.last_wear_per = self.wear_per
 
             # Estimated tyre lifespan in laps
-            if self.wcfg["show_lifespan"]:
-                self.wear_laps = tuple(map(self.estimated_laps, wear_curr, self.wear_per))
-                self.update_laps("fl", self.wear_laps[0], self.last_wear_laps[0],
-                                 self.wcfg["warning_threshold_laps"])
-                self.update_laps("fr", self.wear_laps[1], self.last_wear_laps[1],
-                                 self.wcfg["warning_threshold_laps"])
-                self.update_laps("rl", self.wear_laps[2], self.last_wear_laps[2],
-                                 self.wcfg["warning_threshold_laps"])
-                self.update_laps("rr", self.wear_laps[3], self.last_wear_laps[3],
-                                 self.wcfg["warning_threshold_laps"])
-                self.last_wear_laps = self.wear_laps
+            if self.show_lifespan:
+                # Estimated lifespan = remaining / last lap wear
+                self.wear_laps = tuple([
+                    min(value / max(wear_per, 0.001), 999)
+                    for value, wear_per in zip(wear_curr, self.wear_per)
+                ])
+                if self.wear_laps != self.last_wear_laps:
+                    self.update_laps(0, self.wear_laps[0], self.last_wear_laps[0])
+                    self.update_laps(1, self.wear_laps[1], self.last_wear_laps[1])
+                    self.update_laps(2, self.wear_laps[2], self.last_wear_laps[2])
+                    self.update_laps(3, self.wear_laps[3], self.last_wear_laps[3])
+                    self.last_wear_laps = self.wear_laps
         else:
             if self.checked:
                 self.checked = False
-                self.wear_last = [0,0,0,0]
-                self.wear_live = [0,0,0,0]
-                self.wear_per = [0,0,0,0]
-                self.wear_laps = [0,0,0,0]
+                self.last_wear_state = None
+                self.wear_last = (0,0,0,0)
+                self.wear_live = (0,0,0,0)
+                self.wear_per = (0,0,0,0)
+                self.wear_laps = (0,0,0,0)
 
     # GUI update methods
-    def update_wear(self, suffix, curr, last, color):
+    def update_wear(self, idx, curr, last):
         """Remaining tyre wear"""
         if curr != last:
-            getattr(self, f"bar_twear_{suffix}").setText(self.format_num(curr))
-            getattr(self, f"bar_twear_{suffix}").setStyleSheet(
-                f"color: {self.color_wear(curr, color)};"
-                f"background: {self.wcfg['bkg_color_remaining']};"
-                f"min-width: {self.bar_width}px;"
-            )
-
-    def update_diff(self, suffix, curr, last, color):
+            text = self.format_num(curr)
+            if text != self.text_twear[idx]:
+                self.text_twear[idx] = text
+                self.bars_twear[idx].setText(text)
+            warning = curr <= self.threshold_remaining
+            if warning != self.warning_twear[idx]:
+                self.warning_twear[idx] = warning
+                self.bars_twear[idx].setStyleSheet(
+                    self.style_twear[warning])
+
+    def update_diff(self, idx, curr, last):
         """Tyre wear differences"""
         if curr != last:
-            getattr(self, f"bar_tdiff_{suffix}").setText(f"{curr:.02f}"[:4].rjust(4))
-            getattr(self, f"bar_tdiff_{suffix}").setStyleSheet(
-                f"color: {self.color_diff(curr, color)};"
-                f"background: {self.wcfg['bkg_color_wear_difference']};"
-                f"min-width: {self.bar_width}px;"
-            )
-
-    def update_laps(self, suffix, curr, last, color):
+            text = f"{curr:.02f}"[:4]  # wear difference is never negative, always 4 chars
+            if text != self.text_tdiff[idx]:
+                self.text_tdiff[idx] = text
+                self.bars_tdiff[idx].setText(text)
+            warning = curr >= self.threshold_wear
+            if warning != self.warning_tdiff[idx]:
+                self.warning_tdiff[idx] = warning
+                self.bars_tdiff[idx].setStyleSheet(
+                    self.style_tdiff[warning])
+
+    def update_laps(self, idx, curr, last):
         """Estimated tyre lifespan in laps"""
         if curr != last:
-            getattr(self, f"bar_tlaps_{suffix}").setText(self.format_num(curr))
-            getattr(self, f"bar_tlaps_{suffix}").setStyleSheet(
-                f"color: {self.color_laps(curr, color)};"
-                f"background: {self.wcfg['bkg_color_lifespan']};"
-                f"min-width: {self.bar_width}px;"
-            )
+            text = self.format_num(curr)
+            if text != self.text_tlaps[idx]:
+                self.text_tlaps[idx] = text
+                self.bars_tlaps[idx].setText(text)
+            warning = curr <= self.threshold_laps
+            if warning != self.warning_tlaps[idx]:
+                self.warning_tlaps[idx] = warning
+                self.bars_tlaps[idx].setStyleSheet(
+                    self.style_tlaps[warning])
 
     # Additional methods
-    @staticmethod
-    def wear_diff(value, wear_last, wear_live):
-        """Tyre wear differences"""
-        if wear_last < value:
-            wear_last = value
-        elif wear_last > value:
-            wear_live += wear_last - value
-            wear_last = value
-        return wear_last, wear_live
-
-    @staticmethod
-    def estimated_laps(wear_curr, wear_per):
-        """Estimated tyre lifespan in laps = remaining / last lap wear"""
-        return min(wear_curr / max(wear_per, 0.001), 999)
+    def bar_style(self, suffix):
+        """Bar style sheet: normal, warning"""
+        return tuple(
+            f"color: {font_color};"
+            f"background: {self.wcfg[f'bkg_color_{suffix}']};"
+            f"min-width: {self.bar_width}px;"
+            for font_color in (self.wcfg[f"font_color_{suffix}"], self.wcfg["font_color_warning"])
+        )
 
     @staticmethod
-    def round2decimal(value):
-        """Round 2 decimal"""
-        return round(value * 100, 2)
+    def generate_group(caption, caption_style, bar_style, text):
+        """Generate group layout with optional caption & tyre bars in order: fl, fr, rl, rr"""
+        layout_group = QGridLayout()
+        layout_group.setSpacing(0)
+
+        if caption_style:
+            bar_desc = QLabel(caption)
+            bar_desc.setAlignment(Qt.AlignCenter)
+            bar_desc.setStyleSheet(caption_style)
+            layout_group.addWidget(bar_desc, 0, 0, 1, 0)
+
+        bars = []
+        for idx in range(4):
+            bar_tyre = QLabel(text)
+            bar_tyre.setAlignment(Qt.AlignCenter)
+            bar_tyre.setStyleSheet(bar_style)
+            layout_group.addWidget(bar_tyre, idx // 2 + 1, idx % 2)
+            bars.append(bar_tyre)
+        return layout_group, tuple(bars)
 
     @staticmethod
     def format_num(value):
@@ -341,21 +308,3 @@ class Draw(Widget):
         if value > 99.9:
             return f"{value:.0f}"
         return f"{value:.01f}"
-
-    def color_wear(self, tyre_wear, threshold):
-        """Warning color for remaining tyre"""
-        if tyre_wear <= threshold:
-            return self.wcfg["font_color_warning"]
-        return self.wcfg["font_color_remaining"]
-
-    def color_diff(self, tyre_wear, threshold):
-        """Warning color for tyre wear differences"""
-        if tyre_wear >= threshold:
-            return self.wcfg["font_color_warning"]
-        return self.wcfg["font_color_wear_difference"]
-
-    def color_laps(self, tyre_wear, threshold):
-        """Warning color for estimated tyre lifespan"""
-        if tyre_wear <= threshold:
-            return self.wcfg["font_color_warning"]
-        return self.wcfg["font_color_lifespan"]